@@ -1,19 +1,101 @@
 import os
+import re
+import ssl
+import uuid
+import base64
 import smtplib
 import logging
+from contextlib import ExitStack
+from email.message import Message
+from email.mime.base import MIMEBase
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from email.mime.application import MIMEApplication
-from typing import List, Optional
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
+from email.policy import SMTP
+from typing import IO, Iterator, List, Optional, Tuple, Union
+from src.smtp_pool import SMTPConnectionPool
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Raw bytes per base64 line; 57 bytes encode to the RFC 2045 limit of 76 characters
+BASE64_LINE_BYTES = 57
+# Raw bytes read from an attachment stream at a time
+ATTACHMENT_CHUNK_SIZE = BASE64_LINE_BYTES * 1024
+# Seconds to wait on each SMTP socket operation
+SMTP_TIMEOUT = 30
+
+
+def _header_bytes(part: Message) -> bytes:
+    """
+    Serialize only the headers of a MIME part, followed by the blank separator line.
+
+    Args:
+        part (Message): The MIME part whose headers to serialize.
+
+    Returns:
+        bytes: CRLF-terminated header block.
+    """
+    policy = part.policy.clone(linesep="\r\n")
+    headers = b"".join(policy.fold_binary(name, value) for name, value in part.items())
+    return headers + b"\r\n"
+
+
+def _quote_periods(data: bytes) -> bytes:
+    """
+    Dot-stuff lines beginning with a period, as required inside SMTP DATA.
+
+    Args:
+        data (bytes): CRLF-terminated message data.
+
+    Returns:
+        bytes: The data with leading periods doubled.
+    """
+    return re.sub(rb"(?m)^\.", b"..", data)
+
+
+def _iter_base64_lines(stream: IO[bytes]) -> Iterator[bytes]:
+    """
+    Base64-encode a binary stream into CRLF-terminated lines, one chunk at a time.
+
+    Args:
+        stream (IO[bytes]): The stream to encode.
+
+    Yields:
+        bytes: Encoded lines for up to ATTACHMENT_CHUNK_SIZE raw bytes.
+    """
+    pending = b""
+    while True:
+        chunk = stream.read(ATTACHMENT_CHUNK_SIZE)
+        if not chunk:
+            break
+        pending += chunk
+        # Only encode whole lines so chunk boundaries never split a line
+        whole = len(pending) - len(pending) % BASE64_LINE_BYTES
+        if whole:
+            yield base64.encodebytes(pending[:whole]).replace(b"\n", b"\r\n")
+            pending = pending[whole:]
+    if pending:
+        yield base64.encodebytes(pending).replace(b"\n", b"\r\n")
+
+
+class _ResumingSSLContext(ssl.SSLContext):
+    """
+    An SSLContext that offers the last cached TLS session when wrapping a socket,
+    so reconnects to the same server resume it instead of running a full handshake.
+
+    Attributes:
+        session (Optional[ssl.SSLSession]): Session offered on the next handshake.
+    """
+
+    session: Optional[ssl.SSLSession] = None
+
+    def wrap_socket(self, sock, *args, **kwargs):
+        """Wrap a socket, offering the cached session for resumption."""
+        if self.session is not None:
+            kwargs.setdefault("session", self.session)
+        return super().wrap_socket(sock, *args, **kwargs)
+
 
 class EmailClient:
     """
@@ -24,6 +106,9 @@ class EmailClient:
         smtp_port (int): Gmail's SMTP server port.
         email (str): The sender's email address.
         password (str): The sender's email password or app password.
+        max_messages_per_connection (int): Messages sent before an SMTP session is recycled.
+        max_connections (int): Maximum number of SMTP sessions open at once.
+        timeout (float): Seconds to wait on each SMTP socket operation.
     """
 
     def __init__(
@@ -32,6 +117,9 @@ class EmailClient:
         password: str,
         smtp_server: str = "smtp.gmail.com",
         smtp_port: int = 587,
+        max_messages_per_connection: int = 100,
+        max_connections: int = 5,
+        timeout: float = SMTP_TIMEOUT,
     ):
         """
         Initialize the EmailClient.
@@ -41,11 +129,175 @@ class EmailClient:
             password (str): The sender's email password or app password.
             smtp_server (str, optional): SMTP server address. Defaults to "smtp.gmail.com".
             smtp_port (int, optional): SMTP server port. Defaults to 587.
+            max_messages_per_connection (int, optional): Messages sent before an SMTP session is recycled. Defaults to 100.
+            max_connections (int, optional): Maximum number of SMTP sessions open at once. Defaults to 5.
+            timeout (float, optional): Seconds to wait on each SMTP socket operation. Defaults to SMTP_TIMEOUT.
         """
         self.smtp_server = smtp_server
         self.smtp_port = smtp_port
         self.email = email
         self.password = password
+        self.max_messages_per_connection = max_messages_per_connection
+        self.max_connections = max_connections
+        self.timeout = timeout
+        # One context per client so every pooled session can resume the same TLS session
+        self._ssl_context = _ResumingSSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        self._ssl_context.load_default_certs()
+        self._pool = SMTPConnectionPool(
+            self._connect,
+            max_connections=max_connections,
+            max_messages_per_connection=max_messages_per_connection,
+        )
+
+    @classmethod
+    def from_env(cls, **kwargs) -> "EmailClient":
+        """
+        Create an EmailClient from the GMAIL_EMAIL and GMAIL_PASSWORD environment
+        variables, loading them from a .env file first if one exists.
+
+        Args:
+            **kwargs: Additional keyword arguments passed to the constructor.
+
+        Returns:
+            EmailClient: The configured client.
+
+        Raises:
+            ValueError: If either environment variable is missing.
+        """
+        from dotenv import load_dotenv
+
+        # Load environment variables from .env file
+        load_dotenv()
+
+        email = os.getenv("GMAIL_EMAIL")
+        password = os.getenv("GMAIL_PASSWORD")
+        if not email or not password:
+            raise ValueError("GMAIL_EMAIL and GMAIL_PASSWORD must be set")
+        return cls(email=email, password=password, **kwargs)
+
+    def _connect(self) -> smtplib.SMTP:
+        """
+        Open a new SMTP session, upgrade it to TLS and authenticate.
+
+        Returns:
+            smtplib.SMTP: The authenticated SMTP session.
+        """
+        # A timeout keeps a pooled session whose connection died silently from
+        # blocking NOOP, and its pool slot, forever
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=self.timeout)
+        try:
+            # Upgrade the connection to secure
+            server.starttls(context=self._ssl_context)
+            server.login(self.email, self.password)  # Authenticate
+        except BaseException:
+            server.close()
+            raise
+        # Cache the session after login so TLS 1.3 tickets sent post-handshake are included
+        self._ssl_context.session = server.sock.session
+        logger.info(
+            f"Connected to SMTP server {self.smtp_server}:{self.smtp_port} "
+            f"(TLS session reused: {server.sock.session_reused})"
+        )
+        return server
+
+    def close(self) -> None:
+        """Close all pooled SMTP sessions."""
+        self._pool.close_all()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+        return False
+
+    @staticmethod
+    def _open_attachment(
+        attachment: Union[str, IO[bytes]], stack: ExitStack
+    ) -> Tuple[str, IO[bytes]]:
+        """
+        Resolve an attachment to a filename and an open binary stream.
+
+        Args:
+            attachment (Union[str, IO[bytes]]): File path or binary stream.
+            stack (ExitStack): Stack that closes files opened from paths.
+
+        Returns:
+            Tuple[str, IO[bytes]]: The attachment filename and its stream.
+        """
+        if isinstance(attachment, (str, os.PathLike)):
+            stream = stack.enter_context(open(attachment, "rb"))
+            return os.path.basename(attachment), stream
+
+        name = getattr(attachment, "name", None)
+        filename = os.path.basename(name) if isinstance(name, str) else "attachment"
+        return filename, attachment
+
+    @staticmethod
+    def _stream_message(
+        server: smtplib.SMTP,
+        from_email: str,
+        to_emails: List[str],
+        msg: MIMEMultipart,
+        attachments: List[Tuple[str, IO[bytes]]],
+    ) -> None:
+        """
+        Send a message over the SMTP DATA command, base64-encoding attachments
+        chunk by chunk so no attachment is ever held in memory in full.
+
+        Args:
+            server (smtplib.SMTP): An authenticated SMTP session.
+            from_email (str): The envelope sender.
+            to_emails (List[str]): The envelope recipients.
+            msg (MIMEMultipart): The message holding the headers and body part.
+            attachments (List[Tuple[str, IO[bytes]]]): Filenames and streams to attach.
+
+        Raises:
+            smtplib.SMTPException: If the server rejects the sender, every recipient or the data.
+        """
+        server.ehlo_or_helo_if_needed()
+        code, resp = server.mail(from_email)
+        if code != 250:
+            server.rset()
+            raise smtplib.SMTPSenderRefused(code, resp, from_email)
+        refused = {}
+        for recipient in to_emails:
+            code, resp = server.rcpt(recipient)
+            if code not in (250, 251):
+                refused[recipient] = (code, resp)
+        if len(refused) == len(to_emails):
+            server.rset()
+            raise smtplib.SMTPRecipientsRefused(refused)
+
+        server.putcmd("data")
+        code, resp = server.getreply()
+        if code != 354:
+            raise smtplib.SMTPDataError(code, resp)
+
+        boundary = f"==============={uuid.uuid4().hex}=="
+        msg.set_boundary(boundary)
+        delimiter = f"--{boundary}\r\n".encode("ascii")
+
+        server.send(_header_bytes(msg))
+        for part in msg.get_payload():
+            server.send(delimiter)
+            server.send(_quote_periods(part.as_bytes()) + b"\r\n")
+
+        for filename, stream in attachments:
+            part = MIMEBase("application", "octet-stream", policy=SMTP, name=filename)
+            part["Content-Transfer-Encoding"] = "base64"
+            part["Content-Disposition"] = f'attachment; filename="{filename}"'
+            server.send(delimiter)
+            server.send(_header_bytes(part))
+            for chunk in _iter_base64_lines(stream):
+                server.send(chunk)
+
+        server.send(f"--{boundary}--\r\n.\r\n".encode("ascii"))
+        code, resp = server.getreply()
+        if code != 250:
+            raise smtplib.SMTPDataError(code, resp)
 
     def send_email(
         self,
@@ -54,7 +306,7 @@ class EmailClient:
         body: str,
         from_email: Optional[str] = None,
         is_html: bool = False,
-        attachments: Optional[List[str]] = None,
+        attachments: Optional[List[Union[str, IO[bytes]]]] = None,
     ) -> bool:
         """
         Send an email using Gmail's SMTP server.
@@ -65,56 +317,135 @@ class EmailClient:
             body (str): The body of the email.
             from_email (Optional[str], optional): The sender's email address. Defaults to the email used in initialization.
             is_html (bool, optional): Whether the body is HTML. Defaults to False.
-            attachments (Optional[List[str]], optional): List of file paths to attach to the email.
+            attachments (Optional[List[Union[str, IO[bytes]]]], optional): File paths or binary streams to attach to the email. Streams are read but not closed.
 
         Returns:
             bool: True if the email was sent successfully, False otherwise.
         """
         # Use the provided "from_email" or default to the initialized email
         from_email = from_email or self.email
+        msg = self._build_message(from_email, to_emails, subject, body, is_html)
 
-        # Create the email message
-        msg = MIMEMultipart()
-        msg["From"] = from_email
+        with ExitStack() as stack:
+            # Open attachments up front so a bad path fails before connecting
+            streams = []
+            for attachment in attachments or []:
+                try:
+                    streams.append(self._open_attachment(attachment, stack))
+                    logger.info(f"Attached file: {streams[-1][0]}")
+                except Exception as e:
+                    logger.error(f"Failed to attach file {attachment}: {e}")
+                    return False
+
+            return self._deliver(msg, from_email, to_emails, streams)
+
+    def send_bulk(
+        self,
+        messages: List[Tuple[List[str], str, str]],
+        from_email: Optional[str] = None,
+        is_html: bool = False,
+    ) -> List[bool]:
+        """
+        Send several emails without attachments from the same sender.
+
+        The sender header is parsed once and reused for every message, and
+        sessions are shared through the connection pool.
+
+        Args:
+            messages (List[Tuple[List[str], str, str]]): (to_emails, subject, body) for each email.
+            from_email (Optional[str], optional): The sender's email address. Defaults to the email used in initialization.
+            is_html (bool, optional): Whether the bodies are HTML. Defaults to False.
+
+        Returns:
+            List[bool]: Whether each email was sent successfully, in order.
+        """
+        from_email = from_email or self.email
+        # A parsed header object is stored as-is instead of being re-parsed per message
+        from_header = SMTP.header_factory("From", from_email)
+
+        return [
+            self._deliver(
+                self._build_message(from_header, to_emails, subject, body, is_html),
+                from_email,
+                to_emails,
+            )
+            for to_emails, subject, body in messages
+        ]
+
+    @staticmethod
+    def _build_message(
+        from_header: str,
+        to_emails: List[str],
+        subject: str,
+        body: str,
+        is_html: bool,
+    ) -> MIMEMultipart:
+        """
+        Create the multipart message holding the headers and body part.
+
+        Args:
+            from_header (str): The From header value, or an already parsed header.
+            to_emails (List[str]): List of recipient email addresses.
+            subject (str): The subject of the email.
+            body (str): The body of the email.
+            is_html (bool): Whether the body is HTML.
+
+        Returns:
+            MIMEMultipart: The message, without attachments.
+        """
+        # The SMTP policy serializes with CRLF line endings and modern header encoding
+        msg = MIMEMultipart(policy=SMTP)
+        msg["From"] = from_header
         msg["To"] = ", ".join(to_emails)
         msg["Subject"] = subject
 
         # Attach the body as plain text or HTML
-        if is_html:
-            msg.attach(MIMEText(body, "html"))
-        else:
-            msg.attach(MIMEText(body, "plain"))
-
-        # Attach files if provided
-        if attachments:
-            for filepath in attachments:
-                try:
-                    with open(filepath, "rb") as f:
-                        part = MIMEApplication(
-                            f.read(), Name=os.path.basename(filepath)
-                        )
-
-                    # Add header for attachment
-                    part["Content-Disposition"] = (
-                        f'attachment; filename="{os.path.basename(filepath)}"'
-                    )
-                    msg.attach(part)
-                    logger.info(f"Attached file: {filepath}")
-                except Exception as e:
-                    logger.error(f"Failed to attach file {filepath}: {e}")
-                    return False
+        msg.attach(MIMEText(body, "html" if is_html else "plain", policy=SMTP))
+        return msg
 
+    def _deliver(
+        self,
+        msg: MIMEMultipart,
+        from_email: str,
+        to_emails: List[str],
+        attachments: Optional[List[Tuple[str, IO[bytes]]]] = None,
+    ) -> bool:
+        """
+        Send a built message over a pooled SMTP session.
+
+        Args:
+            msg (MIMEMultipart): The message to send.
+            from_email (str): The envelope sender.
+            to_emails (List[str]): The envelope recipients.
+            attachments (Optional[List[Tuple[str, IO[bytes]]]], optional): Opened attachments to stream after the body.
+
+        Returns:
+            bool: True if the email was sent successfully, False otherwise.
+        """
         try:
-            # Connect to the SMTP server
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()  # Upgrade the connection to secure
-                server.login(self.email, self.password)  # Authenticate
-                server.sendmail(
-                    from_email, to_emails, msg.as_string()
-                )  # Send the email
-
-            logger.info(f"Email sent successfully to {to_emails}")
-            return True
-        except smtplib.SMTPException as e:
-            logger.error(f"Failed to send email: {e}")
+            # Check out a pooled SMTP session, connecting only when none is idle
+            server = self._pool.acquire()
+        except (smtplib.SMTPException, OSError) as e:
+            # OSError covers DNS failures, refused connections and TLS/certificate errors
+            logger.error("Failed to send email: %s", e)
             return False
+
+        broken = True
+        try:
+            if attachments:
+                # Encode attachments straight onto the socket
+                self._stream_message(server, from_email, to_emails, msg, attachments)
+            else:
+                # Serialize with BytesGenerator rather than building a str copy
+                server.send_message(msg, from_addr=from_email, to_addrs=to_emails)
+            broken = False
+        except Exception as e:
+            # Attachment streams can fail with more than OSError, e.g. ValueError when closed
+            logger.error("Failed to send email: %s", e)
+            return False
+        finally:
+            # A failed session is dropped so the next send starts from a clean connection
+            self._pool.release(server, broken=broken)
+
+        logger.info("Email sent successfully to %s", to_emails)
+        return True
@@ -0,0 +1,128 @@
+import logging
+import sqlite3
+from typing import Any, Dict, Mapping, Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class ReportCache:
+    """
+    An on-disk cache of parsed reports keyed by URL, with their HTTP validators.
+
+    The stored ``ETag`` and ``Last-Modified`` values are sent back as
+    ``If-None-Match`` and ``If-Modified-Since`` so an unchanged report page is
+    answered with 304 and its cached report reused. Entries are kept in a single
+    SQLite table ``reports(url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, report BLOB)``.
+
+    Attributes:
+        path (str): Path of the SQLite database file.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the ReportCache, creating the database if needed.
+
+        Args:
+            path (str): Path of the SQLite database file.
+        """
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS reports "
+            "(url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, report BLOB)"
+        )
+        self._conn.commit()
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """
+        Build the conditional request headers for a cached report.
+
+        Args:
+            url (str): URL of the report.
+
+        Returns:
+            Dict[str, str]: ``If-None-Match``/``If-Modified-Since`` headers, empty if the URL is not cached.
+        """
+        try:
+            row = self._conn.execute(
+                "SELECT etag, last_modified FROM reports WHERE url = ?", (url,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.error(f"Error reading report cache: {str(e)}")
+            return {}
+        if row is None:
+            return {}
+
+        etag, last_modified = row
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up the cached report for a URL.
+
+        Args:
+            url (str): URL of the report.
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached report, or None if it is not cached.
+        """
+        import orjson
+
+        try:
+            row = self._conn.execute(
+                "SELECT report FROM reports WHERE url = ?", (url,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.error(f"Error reading report cache: {str(e)}")
+            return None
+        return orjson.loads(row[0]) if row else None
+
+    def put(self, url: str, headers: Mapping[str, str], report: Dict[str, Any]) -> bool:
+        """
+        Cache a parsed report if its response carries a validator.
+
+        Args:
+            url (str): URL of the report.
+            headers (Mapping[str, str]): Response headers of the report page.
+            report (Dict[str, Any]): The parsed report.
+
+        Returns:
+            bool: True if the report was cached, False otherwise.
+        """
+        import orjson
+
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return False
+        try:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO reports (url, etag, last_modified, report) "
+                    "VALUES (?, ?, ?, ?)",
+                    (url, etag, last_modified, orjson.dumps(report)),
+                )
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Error writing report cache: {str(e)}")
+            return False
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+        return False
@@ -0,0 +1,94 @@
+import logging
+import sqlite3
+from datetime import datetime
+from typing import Iterable, List, Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class SeenUrlStore:
+    """
+    An on-disk record of report URLs that have already been processed.
+
+    Senate reports are never changed once published, so a URL only needs to
+    be scraped once. URLs are kept in a single SQLite table
+    ``urls(url TEXT PRIMARY KEY, ts TEXT)``.
+
+    Attributes:
+        path (str): Path of the SQLite database file.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the SeenUrlStore, creating the database if needed.
+
+        Args:
+            path (str): Path of the SQLite database file.
+        """
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS urls (url TEXT PRIMARY KEY, ts TEXT)"
+        )
+        self._conn.commit()
+
+    def filter_new(self, urls: List[str]) -> List[str]:
+        """
+        Drop the URLs that have already been processed, keeping the original order.
+
+        Args:
+            urls (List[str]): Candidate report URLs.
+
+        Returns:
+            List[str]: URLs not seen before, or all of them if the store cannot be read.
+        """
+        try:
+            return [
+                url
+                for url in urls
+                if self._conn.execute(
+                    "SELECT 1 FROM urls WHERE url = ?", (url,)
+                ).fetchone()
+                is None
+            ]
+        except sqlite3.Error as e:
+            logger.error(f"Error reading seen URLs: {str(e)}")
+            return list(urls)
+
+    def add(self, urls: Iterable[str], timestamp: Optional[str] = None) -> bool:
+        """
+        Record URLs as processed.
+
+        Args:
+            urls (Iterable[str]): Report URLs that were processed successfully.
+            timestamp (Optional[str]): ISO timestamp to store with the URLs. Defaults to now.
+
+        Returns:
+            bool: True if the URLs were recorded, False otherwise.
+        """
+        timestamp = timestamp or datetime.now().isoformat()
+        try:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO urls (url, ts) VALUES (?, ?)",
+                    ((url, timestamp) for url in urls),
+                )
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Error recording seen URLs: {str(e)}")
+            return False
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+        return False
@@ -1,80 +1,203 @@
 import logging
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
-from typing import List, Optional, Dict, Any
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
 import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from datetime import datetime
-import json
+from urllib.parse import urljoin
 import os
-from dotenv import load_dotenv
 from src.email_client import EmailClient
+from src.report_cache import ReportCache
+from src.seen_urls import SeenUrlStore
 
-# Load environment variables
-load_dotenv()
+# Selenium, aiohttp, asyncio, requests and lxml are imported where they are used
+# so importing this module stays cheap; these imports only serve the type annotations
+if TYPE_CHECKING:
+    import aiohttp
+    import multiprocessing.sharedctypes
+    import requests
+    from selenium import webdriver
 
 # Module level constants
 TIMEOUT = 10
+# Concurrent HTTP connections used when fetching report pages
+MAX_CONCURRENT_FETCHES = 10
+# Browser worker processes used to process reports in parallel with Selenium
+REPORT_WORKERS = 4
+# Delay between worker start-ups so they do not hit the site in one burst
+WORKER_STAGGER_SECONDS = 0.1
+# Retries for transient HTTP failures on the plain HTTP path; 403 is left
+# alone so the Selenium fallback can take over
+HTTP_RETRIES = 3
+HTTP_RETRY_BACKOFF_SECONDS = 0.5
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+)
 BASE_URL = "https://efdsearch.senate.gov/search/"
+HOME_URL = "https://efdsearch.senate.gov/search/home/"
+REPORT_DATA_URL = "https://efdsearch.senate.gov/search/report/data/"
+# Rows requested per page from the report search endpoint
+REPORT_PAGE_SIZE = 100
+# Periodic transaction report value of the report type filter
+PERIODIC_TRANSACTION_REPORT_TYPE = "11"
+# Transaction table columns, in page order
+TRANSACTION_FIELDS = (
+    "number",
+    "transaction_date",
+    "owner",
+    "ticker",
+    "asset_name",
+    "asset_type",
+    "type",
+    "amount",
+    "comment",
+)
+# Default storage locations; __main__ reads the SEEN_URLS_DB, REPORT_CACHE_DB and
+# CHROME_PROFILE_DIR overrides after loading .env
+# SQLite file recording report URLs that have already been processed
+SEEN_URLS_DB = "seen_urls.sqlite"
+# SQLite file caching parsed reports with their ETag/Last-Modified validators
+REPORT_CACHE_DB = "report_cache.sqlite"
+# Chrome profile kept between runs so static assets are served from the disk cache
+PERSISTENT_PROFILE_DIR = os.path.expanduser("~/.cache/senate-scraper-chrome")
+# Chrome disk cache size in bytes
+CHROME_DISK_CACHE_SIZE = 100 * 1024 * 1024
+# Chrome arguments added unless already present in CHROME_OPTIONS. Only form
+# elements and links are used, so images and extensions are never needed.
+DEFAULT_CHROME_ARGUMENTS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--blink-settings=imagesEnabled=false",
+    "--disable-infobars",
+    "--disable-popup-blocking",
+    "--disable-features=Translate,MediaRouter",
+]
+CHROME_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.default_content_setting_values.notifications": 2,
+}
+# Element locators as (By strategy, selector) pairs; the strategies are spelled
+# as By's string values so building them does not import Selenium
+AGREE_LOC = ("id", "agree_statement")
+SEARCH_FORM_LOC = ("id", "reportTypes")
+REPORT_TYPE_LOC = (
+    "css selector",
+    f"#reportTypes[value='{PERIODIC_TRANSACTION_REPORT_TYPE}']",
+)
+FROM_DATE_LOC = ("id", "fromDate")
+SEARCH_BUTTON_LOC = ("css selector", "button[type='submit']")
+RESULT_ROW_LOC = ("css selector", "tbody tr")
+EMPTY_RESULTS_LOC = ("class name", "dataTables_empty")
+TABLE_LOC = ("css selector", "table.table")
+# Stops any subresources still loading, then returns the trimmed text of every
+# cell of the table passed as arguments[0], skipping the header row
+EXTRACT_TABLE_CELLS_JS = """
+window.stop();
+return Array.from(arguments[0].querySelectorAll('tr')).slice(1).map(
+    row => Array.from(row.querySelectorAll('td')).map(cell => cell.innerText.trim())
+);
+"""
+# Posts the report search form in arguments[0] to the URL in arguments[1] from
+# inside the page, so the browser's own cookies and CSRF token are used, and hands
+# the result rows (or an error message) to the async script callback
+FETCH_REPORT_DATA_JS = """
+const [form, url, done] = arguments;
+const csrf = (document.cookie.match(/(?:^|; )csrftoken=([^;]*)/) || [])[1] || '';
+fetch(url, {
+    method: 'POST',
+    credentials: 'same-origin',
+    headers: {'X-CSRFToken': csrf},
+    body: new URLSearchParams({...form, csrfmiddlewaretoken: csrf}),
+})
+    .then(response => response.ok ? response.json() : Promise.reject('HTTP ' + response.status))
+    .then(result => done({data: result.data}), error => done({error: String(error)}));
+"""
+EXTRACT_REPORT_URLS_JS = (
+    "return Array.from(document.querySelectorAll('tbody a[href]')).map(a => a.href);"
+)
 
 # Configure basic logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-class SenateScraper:
-    """A class to scrape financial disclosure data from the Senate website."""
+class EFDAccessDeniedError(Exception):
+    """Raised when the Senate website refuses plain HTTP access (HTTP 403)."""
 
-    def __init__(
-        self, headless: bool = True, email_client: Optional[EmailClient] = None
-    ):
-        """
-        Initialize the scraper with configuration.
 
-        Args:
-            headless (bool): Whether to run browser in headless mode
-            email_client (Optional[EmailClient]): EmailClient instance for notifications
-        """
-        logger.info("Initializing SenateScraper...")
-        self.driver = self._setup_driver(headless)
-        self.email_client = email_client
+def _report_search_form(from_date: str, start: int) -> Dict[str, str]:
+    """
+    Build the report search form for one page of periodic transaction reports.
 
-    def _setup_driver(self, headless: bool) -> webdriver.Chrome:
-        """
-        Set up and configure Chrome WebDriver.
+    Args:
+        from_date (str): Earliest submission date as MM/DD/YYYY
+        start (int): Index of the first row of the page
 
-        Args:
-            headless (bool): Whether to run browser in headless mode
+    Returns:
+        Dict[str, str]: Form fields for the report search endpoint, without the CSRF token
+    """
+    return {
+        "start": str(start),
+        "length": str(REPORT_PAGE_SIZE),
+        "report_types": f"[{PERIODIC_TRANSACTION_REPORT_TYPE}]",
+        "filer_types": "[]",
+        "submitted_start_date": f"{from_date} 00:00:00",
+        "submitted_end_date": "",
+        "candidate_state": "",
+        "senator_state": "",
+        "office_id": "",
+        "first_name": "",
+        "last_name": "",
+    }
 
-        Returns:
-            webdriver.Chrome: Configured Chrome WebDriver instance
-        """
-        options = webdriver.ChromeOptions()
 
-        # Check if CHROME_OPTIONS environment variable exists
-        if os.getenv('CHROME_OPTIONS'):
-            # Use environment variable settings
-            chrome_options = os.getenv('CHROME_OPTIONS', '').split()
-            for option in chrome_options:
-                options.add_argument(option)
+def _report_urls_from_rows(rows: List[List[str]]) -> List[str]:
+    """
+    Extract report URLs from report search result rows.
 
-            # Ensure these basic options are set if not in environment
-            if '--no-sandbox' not in chrome_options:
-                options.add_argument('--no-sandbox')
-            if '--disable-dev-shm-usage' not in chrome_options:
-                options.add_argument('--disable-dev-shm-usage')
-            if headless and '--headless' not in chrome_options:
-                options.add_argument('--headless')
-        else:
-            # Use basic settings without environment variable
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            if headless:
-                options.add_argument('--headless')
+    Args:
+        rows (List[List[str]]): Rows of the report search endpoint's ``data`` field
 
-        return webdriver.Chrome(options=options)
+    Returns:
+        List[str]: Absolute report URLs
+    """
+    from lxml import html
+
+    urls = []
+    for row in rows:
+        # The fourth column holds the report link as an HTML fragment
+        link = html.fragment_fromstring(row[3], create_parent=True)
+        urls.extend(urljoin(BASE_URL, href) for href in link.xpath(".//a/@href"))
+    return urls
+
+
+class BaseScraper(ABC):
+    """Common report processing, saving and notification for Senate scrapers."""
+
+    def __init__(self, email_client: Optional[EmailClient] = None):
+        """
+        Initialize the scraper with configuration.
+
+        Args:
+            email_client (Optional[EmailClient]): EmailClient instance for notifications
+        """
+        self.email_client = email_client
 
     def send_notification(
         self, subject: str, body: str, attachments: Optional[List[str]] = None
@@ -96,6 +219,490 @@ class SenateScraper:
                 attachments=attachments,
             )
 
+    @abstractmethod
+    def find_report_urls(self) -> Optional[List[str]]:
+        """
+        Search for today's periodic transaction reports.
+
+        Returns:
+            Optional[List[str]]: Report URLs found, or None if the search could not be run
+        """
+
+    @abstractmethod
+    def process_single_report(
+        self, url: str, timestamp: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Process a single report URL and extract relevant information.
+
+        Args:
+            url (str): URL of the report to process
+            timestamp (Optional[str]): ISO timestamp to record on the report. Defaults to now.
+
+        Returns:
+            Optional[Dict[str, Any]]: Dictionary containing extracted information or None if extraction fails
+        """
+
+    @staticmethod
+    def _log_transactions(url: str, transactions: List[Dict[str, str]]) -> None:
+        """
+        Log a per-report transaction count, with each transaction at DEBUG level.
+
+        Args:
+            url (str): URL of the processed report
+            transactions (List[Dict[str, str]]): Transactions extracted from the report
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            for transaction in transactions:
+                logger.debug(f"Extracted transaction: {transaction}")
+        logger.info(f"Extracted {len(transactions)} transactions from {url}")
+
+    def _build_report(
+        self, url: str, rows: List[List[str]], timestamp: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Build a report from the cell text of its transaction table rows.
+
+        Args:
+            url (str): URL of the report
+            rows (List[List[str]]): Cell text of each table row, without the header row
+            timestamp (Optional[str]): ISO timestamp to record on the report. Defaults to now.
+
+        Returns:
+            Dict[str, Any]: Dictionary containing extracted information
+        """
+        report_data = {
+            "url": url,
+            "timestamp": timestamp or datetime.now().isoformat(),
+            "transactions": [
+                dict(zip(TRANSACTION_FIELDS, cells))
+                for cells in rows
+                if len(cells) >= len(TRANSACTION_FIELDS)  # Ensure we have all columns
+            ],
+        }
+        self._log_transactions(url, report_data["transactions"])
+        return report_data
+
+    def _parse_report(
+        self, url: str, content: Union[str, bytes], timestamp: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Extract the transactions from the HTML of a report page.
+
+        Args:
+            url (str): URL of the report
+            content (Union[str, bytes]): HTML of the report page
+            timestamp (Optional[str]): ISO timestamp to record on the report. Defaults to now.
+
+        Returns:
+            Optional[Dict[str, Any]]: Dictionary containing extracted information or None if extraction fails
+        """
+        from lxml import etree, html
+
+        try:
+            tables = html.fromstring(content).xpath(
+                "//table[contains(concat(' ', normalize-space(@class), ' '), ' table ')]"
+            )
+        except (etree.LxmlError, ValueError) as e:
+            logger.error(f"Error parsing report at {url}: {str(e)}")
+            return None
+        if not tables:
+            logger.error(f"No transactions table found in report at {url}")
+            return None
+
+        # Extract table rows (skip header row)
+        rows = [
+            [cell.text_content().strip() for cell in row.xpath("./td")]
+            for row in tables[0].xpath(".//tr")[1:]
+        ]
+        return self._build_report(url, rows, timestamp)
+
+    def process_all_reports(
+        self, report_urls: List[str], ndjson_file: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Process all report URLs and collect their information.
+
+        Args:
+            report_urls (List[str]): List of report URLs to process
+            ndjson_file (Optional[str]): File to append each report to as one JSON line as soon as it is processed
+
+        Returns:
+            List[Dict[str, Any]]: List of dictionaries containing extracted information
+        """
+        return self._collect_reports(
+            self._iter_reports(report_urls, datetime.now().isoformat()),
+            [],
+            ndjson_file,
+        )
+
+    def _iter_reports(
+        self, report_urls: List[str], timestamp: str
+    ) -> Iterator[Optional[Dict[str, Any]]]:
+        """
+        Process report URLs one after another in this process.
+
+        Args:
+            report_urls (List[str]): List of report URLs to process
+            timestamp (str): ISO timestamp to record on every report
+
+        Yields:
+            Optional[Dict[str, Any]]: Extracted information for each URL, or None where extraction failed
+        """
+        total = len(report_urls)
+        for i, url in enumerate(report_urls, 1):
+            logger.info(f"Processing report {i} of {total}: {url}")
+            yield self.process_single_report(url, timestamp)
+
+    def _collect_reports(
+        self,
+        results: Iterable[Optional[Dict[str, Any]]],
+        reports: List[Dict[str, Any]],
+        ndjson_file: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Gather successful reports, appending each one to an NDJSON file as it arrives.
+
+        Args:
+            results (Iterable[Optional[Dict[str, Any]]]): Extracted reports, None where extraction failed
+            reports (List[Dict[str, Any]]): List the successful reports are appended to
+            ndjson_file (Optional[str]): File to append each report to as one JSON line
+
+        Returns:
+            List[Dict[str, Any]]: The reports list
+        """
+        with self._ndjson_writer(ndjson_file) as write:
+            for report_data in results:
+                if not report_data:
+                    continue
+                reports.append(report_data)
+                write(report_data)
+        return reports
+
+    @contextmanager
+    def _ndjson_writer(
+        self, ndjson_file: Optional[str]
+    ) -> Iterator[Callable[[Dict[str, Any]], None]]:
+        """
+        Open an NDJSON file for appending reports as one flushed JSON line each.
+
+        Reports whose URL is already in the file, from an earlier or crashed run
+        the same day, are not written again.
+
+        Args:
+            ndjson_file (Optional[str]): File to append reports to, or None to write nothing
+
+        Yields:
+            Callable[[Dict[str, Any]], None]: Function writing one report to the file
+        """
+        import orjson
+
+        f = None
+        written = set()
+        if ndjson_file:
+            try:
+                f = open(ndjson_file, "a+b")
+                f.seek(0)
+                line = b""
+                for line in f:
+                    try:
+                        written.add(orjson.loads(line)["url"])
+                    except (orjson.JSONDecodeError, KeyError, TypeError):
+                        # A line cut short by a crash
+                        continue
+                if line and not line.endswith(b"\n"):
+                    f.write(b"\n")
+            except OSError as e:
+                logger.error(f"Error opening {ndjson_file}: {str(e)}")
+                if f is not None:
+                    f.close()
+                    f = None
+
+        def write(report_data: Dict[str, Any]) -> None:
+            if f is None or report_data["url"] in written:
+                return
+            written.add(report_data["url"])
+            # Flush every line so a crash keeps the reports done so far
+            f.write(orjson.dumps(report_data) + b"\n")
+            f.flush()
+
+        try:
+            yield write
+        finally:
+            if f is not None:
+                f.close()
+
+    def _client_session(
+        self, cookies: Dict[str, str], headers: Optional[Dict[str, str]] = None
+    ) -> "aiohttp.ClientSession":
+        """
+        Create a pooled aiohttp session for fetching report pages.
+
+        Args:
+            cookies (Dict[str, str]): Cookies to send with every request
+            headers (Optional[Dict[str, str]]): Headers to send with every request
+
+        Returns:
+            aiohttp.ClientSession: The session; use it as an async context manager
+        """
+        import aiohttp
+
+        connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_FETCHES)
+        # Time out each connect and read rather than the whole request, which
+        # would also count the wait for a free pooled connection
+        timeout = aiohttp.ClientTimeout(sock_connect=TIMEOUT, sock_read=TIMEOUT)
+        return aiohttp.ClientSession(
+            connector=connector, cookies=cookies, headers=headers, timeout=timeout
+        )
+
+    async def _fetch_pages(
+        self,
+        urls: List[str],
+        cookies: Dict[str, str],
+        headers: Optional[Dict[str, str]] = None,
+        url_headers: Optional[Dict[str, Dict[str, str]]] = None,
+    ) -> List[Optional[Tuple[int, Mapping[str, str], bytes]]]:
+        """
+        Fetch pages concurrently over one pooled aiohttp session.
+
+        Args:
+            urls (List[str]): List of URLs to fetch
+            cookies (Dict[str, str]): Cookies to send with every request
+            headers (Optional[Dict[str, str]]): Headers to send with every request
+            url_headers (Optional[Dict[str, Dict[str, str]]]): Extra headers to send with individual URLs
+
+        Returns:
+            List[Optional[Tuple[int, Mapping[str, str], bytes]]]: Status, headers and raw HTML for each URL, in order, or None where the fetch failed
+        """
+        import asyncio
+
+        url_headers = url_headers or {}
+        logger.info(f"Fetching {len(urls)} reports over HTTP")
+        async with self._client_session(cookies, headers) as session:
+            return await asyncio.gather(
+                *(
+                    self._fetch_report(session, url, url_headers.get(url))
+                    for url in urls
+                )
+            )
+
+    async def _fetch_report(
+        self,
+        session: "aiohttp.ClientSession",
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[Tuple[int, Mapping[str, str], bytes]]:
+        """
+        Fetch a single report page, retrying transient failures.
+
+        Connection errors, timeouts and HTTP_RETRY_STATUSES responses are retried
+        HTTP_RETRIES times with exponential backoff, like the requests session.
+
+        Args:
+            session (aiohttp.ClientSession): Session carrying the site cookies
+            url (str): URL of the report to fetch
+            headers (Optional[Dict[str, str]]): Extra headers to send with the request
+
+        Returns:
+            Optional[Tuple[int, Mapping[str, str], bytes]]: Status, headers and raw HTML, or None if the fetch fails
+        """
+        import asyncio
+        import aiohttp
+
+        for attempt in range(HTTP_RETRIES + 1):
+            retry = attempt < HTTP_RETRIES
+            try:
+                async with session.get(url, headers=headers) as response:
+                    if not (retry and response.status in HTTP_RETRY_STATUSES):
+                        response.raise_for_status()
+                        # Hand lxml the raw bytes so it detects the encoding, as on the requests path
+                        return response.status, response.headers, await response.read()
+                    logger.warning(
+                        f"Got HTTP {response.status} for report at {url}, retrying"
+                    )
+
+            except aiohttp.ClientResponseError as e:
+                logger.error(f"Error fetching report at {url}: {str(e)}")
+                return None
+            except asyncio.TimeoutError:
+                if not retry:
+                    logger.error(f"Timeout while fetching report at {url}")
+                    return None
+                logger.warning(f"Timeout while fetching report at {url}, retrying")
+            except aiohttp.ClientError as e:
+                if not retry:
+                    logger.error(f"Error fetching report at {url}: {str(e)}")
+                    return None
+                logger.warning(f"Error fetching report at {url}, retrying: {str(e)}")
+
+            await asyncio.sleep(HTTP_RETRY_BACKOFF_SECONDS * 2**attempt)
+
+    def save_reports_to_json(
+        self,
+        reports: List[Dict[str, Any]],
+        filename: str = None,
+        pretty: bool = False,
+        columnar: bool = False,
+    ) -> Optional[str]:
+        """
+        Save the collected reports to a JSON file with the current date.
+
+        Args:
+            reports (List[Dict[str, Any]]): List of report dictionaries to save
+            filename (str, optional): Name of the output JSON file. If None, generates with date
+            pretty (bool): Whether to indent the output for human reading
+            columnar (bool): Whether to write each report's transactions as one list per field
+
+        Returns:
+            Optional[str]: Path to the saved file if successful, None otherwise
+        """
+        import orjson
+
+        if filename is None:
+            today = datetime.now().strftime("%Y-%m-%d")
+            filename = f"senate_reports_{today}.json"
+        if columnar:
+            # Output format only: the per-transaction dicts are regrouped into one
+            # list per field, so field names appear once per report
+            reports = [
+                {
+                    **report,
+                    "transactions": {
+                        field: [
+                            transaction[field] for transaction in report["transactions"]
+                        ]
+                        for field in TRANSACTION_FIELDS
+                    },
+                }
+                for report in reports
+            ]
+        try:
+            # orjson writes UTF-8 bytes directly; indentation is opt-in
+            # since the file is mostly consumed by machines
+            with open(filename, "wb") as f:
+                f.write(
+                    orjson.dumps(reports, option=orjson.OPT_INDENT_2 if pretty else 0)
+                )
+            logger.info(f"Successfully saved reports to {filename}")
+            return filename
+        except Exception as e:
+            logger.error(f"Error saving reports to JSON: {str(e)}")
+            return None
+
+    def cleanup(self) -> None:
+        """Clean up resources."""
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.cleanup()
+        if exc_type is not None:
+            logger.error(f"Error occurred: {str(exc_val)}")
+            return False
+        return True
+
+
+class SenateScraper(BaseScraper):
+    """A class to scrape financial disclosure data from the Senate website with Selenium."""
+
+    def __init__(
+        self,
+        headless: bool = True,
+        email_client: Optional[EmailClient] = None,
+        report_workers: int = REPORT_WORKERS,
+        profile_dir: Optional[str] = PERSISTENT_PROFILE_DIR,
+        parse_page_source: bool = False,
+    ):
+        """
+        Initialize the scraper with configuration.
+
+        Args:
+            headless (bool): Whether to run browser in headless mode
+            email_client (Optional[EmailClient]): EmailClient instance for notifications
+            report_workers (int): Browser worker processes used by process_all_reports
+            profile_dir (Optional[str]): Persistent Chrome profile directory, or None for a fresh temporary profile
+            parse_page_source (bool): Whether to parse report tables from the page HTML instead of with injected JavaScript
+        """
+        logger.info("Initializing SenateScraper...")
+        super().__init__(email_client)
+        self.report_workers = report_workers
+        self.profile_dir = profile_dir
+        self.parse_page_source = parse_page_source
+        self.driver = self._setup_driver(headless, profile_dir)
+
+    def _setup_driver(
+        self, headless: bool, profile_dir: Optional[str] = None
+    ) -> "webdriver.Chrome":
+        """
+        Set up and configure Chrome WebDriver.
+
+        Args:
+            headless (bool): Whether to run browser in headless mode
+            profile_dir (Optional[str]): Persistent Chrome profile directory, unless CHROME_OPTIONS sets one
+
+        Returns:
+            webdriver.Chrome: Configured Chrome WebDriver instance
+        """
+        from selenium import webdriver
+
+        options = webdriver.ChromeOptions()
+
+        # Start from CHROME_OPTIONS environment variable settings, if any
+        chrome_options = os.getenv("CHROME_OPTIONS", "").split()
+        for option in chrome_options:
+            options.add_argument(option)
+
+        # Ensure these basic options are set if not in environment
+        for option in DEFAULT_CHROME_ARGUMENTS:
+            if option not in chrome_options:
+                options.add_argument(option)
+        if headless and "--headless" not in chrome_options:
+            options.add_argument("--headless")
+
+        # Reuse a profile between runs so its HTTP cache survives
+        if profile_dir and not any(
+            option.startswith("--user-data-dir") for option in chrome_options
+        ):
+            options.add_argument(f"--user-data-dir={profile_dir}")
+            options.add_argument(f"--disk-cache-size={CHROME_DISK_CACHE_SIZE}")
+
+        # Return from driver.get() at DOMContentLoaded; every step waits
+        # explicitly for the elements it needs
+        options.page_load_strategy = "eager"
+        options.add_experimental_option("prefs", CHROME_PREFS)
+
+        # Attach to an already running ChromeDriver service if one is configured,
+        # which saves starting a driver process on every run
+        webdriver_url = os.getenv("WEBDRIVER_URL")
+        if webdriver_url:
+            logger.info(f"Connecting to WebDriver service at {webdriver_url}")
+            return webdriver.Remote(command_executor=webdriver_url, options=options)
+        return webdriver.Chrome(options=options)
+
+    def find_report_urls(self) -> Optional[List[str]]:
+        """
+        Open the search page, accept the agreement and search for today's reports.
+
+        Returns:
+            Optional[List[str]]: Report URLs found, or None if the search could not be run
+        """
+        if not (self.navigate_to_search() and self.accept_agreement()):
+            return None
+        logger.info("Successfully initialized search page")
+
+        urls = self.fetch_report_index_json()
+        if urls is not None:
+            return urls
+
+        # Fall back to the rendered search form if the endpoint cannot be used
+        if not self.fill_search_form():
+            return None
+        logger.info("Successfully submitted search form")
+        return self.extract_report_urls()
+
     def navigate_to_search(self) -> bool:
         """
         Navigate to the search page.
@@ -119,18 +726,24 @@ class SenateScraper:
         Returns:
             bool: True if agreement was accepted successfully, False otherwise
         """
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException
+
         try:
             logger.info("Attempting to click agreement checkbox")
             agreement_checkbox = WebDriverWait(self.driver, TIMEOUT).until(
-                EC.element_to_be_clickable((By.ID, "agree_statement"))
+                EC.element_to_be_clickable(AGREE_LOC)
             )
             if not agreement_checkbox.is_selected():
                 agreement_checkbox.click()
                 logger.info("Successfully clicked agreement checkbox")
 
-            # Wait for page to load
-            time.sleep(3)  # Wait for 3 seconds
-            logger.info("Waited for page load")
+            # Wait for the search form the next step interacts with
+            WebDriverWait(self.driver, TIMEOUT).until(
+                EC.presence_of_element_located(SEARCH_FORM_LOC)
+            )
+            logger.info("Search form loaded")
 
             return True
 
@@ -141,6 +754,50 @@ class SenateScraper:
             logger.error(f"Error accepting agreement: {str(e)}")
             return False
 
+    def fetch_report_index_json(
+        self, from_date: Optional[str] = None
+    ) -> Optional[List[str]]:
+        """
+        Query the report search endpoint from inside the browser.
+
+        This reads the same JSON the results table is rendered from, without
+        filling in the search form or waiting for the table.
+
+        Args:
+            from_date (Optional[str]): Earliest submission date as MM/DD/YYYY. Defaults to today
+
+        Returns:
+            Optional[List[str]]: Report URLs found, or None if the search failed
+        """
+        from_date = from_date or datetime.now().strftime("%m/%d/%Y")
+        try:
+            logger.info(f"Searching for reports submitted since {from_date}")
+            urls = []
+            start = 0
+            while True:
+                result = self.driver.execute_async_script(
+                    FETCH_REPORT_DATA_JS,
+                    _report_search_form(from_date, start),
+                    REPORT_DATA_URL,
+                )
+                if not result or "error" in result:
+                    error = result.get("error") if result else "no response"
+                    logger.error(f"Report search request failed: {error}")
+                    return None
+
+                rows = result["data"]
+                urls.extend(_report_urls_from_rows(rows))
+                if len(rows) < REPORT_PAGE_SIZE:
+                    break
+                start += REPORT_PAGE_SIZE
+
+            logger.info(f"Extracted {len(urls)} report URLs")
+            return urls
+
+        except Exception as e:
+            logger.error(f"Error searching for reports: {str(e)}")
+            return None
+
     def fill_search_form(self) -> bool:
         """
         Fill out and submit the search form with specified criteria.
@@ -148,14 +805,16 @@ class SenateScraper:
         Returns:
             bool: True if form was submitted successfully, False otherwise
         """
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException
+
         try:
             logger.info("Filling out search form")
 
             # Select report type checkbox for Periodic Transactions
             report_checkbox = WebDriverWait(self.driver, TIMEOUT).until(
-                EC.element_to_be_clickable(
-                    (By.CSS_SELECTOR, "input[id='reportTypes'][value='11']")
-                )
+                EC.element_to_be_clickable(REPORT_TYPE_LOC)
             )
             if not report_checkbox.is_selected():
                 report_checkbox.click()
@@ -164,21 +823,24 @@ class SenateScraper:
             # Enter today's date
             today_date = datetime.now().strftime("%m/%d/%Y")
             date_input = WebDriverWait(self.driver, TIMEOUT).until(
-                EC.presence_of_element_located((By.ID, "fromDate"))
+                EC.presence_of_element_located(FROM_DATE_LOC)
             )
             date_input.send_keys(today_date)
             logger.info(f"Entered date: {today_date}")
 
             # Click search button
-            search_button = self.driver.find_element(
-                By.CSS_SELECTOR, "button[type='submit']"
-            )
+            search_button = self.driver.find_element(*SEARCH_BUTTON_LOC)
             search_button.click()
             logger.info("Clicked search button")
 
-            # Wait for results page
-            time.sleep(3)
-            logger.info("Waited for search results")
+            # Wait until either a result row or the empty-results marker is rendered
+            WebDriverWait(self.driver, TIMEOUT).until(
+                EC.any_of(
+                    EC.presence_of_element_located(RESULT_ROW_LOC),
+                    EC.presence_of_element_located(EMPTY_RESULTS_LOC),
+                )
+            )
+            logger.info("Search results loaded")
 
             return True
 
@@ -197,7 +859,7 @@ class SenateScraper:
             bool: True if no results were found, False otherwise
         """
         try:
-            empty_results = self.driver.find_elements(By.CLASS_NAME, "dataTables_empty")
+            empty_results = self.driver.find_elements(*EMPTY_RESULTS_LOC)
             if empty_results:
                 logger.info("No reports found for today")
                 return True
@@ -216,18 +878,14 @@ class SenateScraper:
         """
         try:
             logger.info("Starting to extract report URLs from results table")
-            urls = []
 
-            # Find the tbody element
-            tbody = self.driver.find_element(By.TAG_NAME, "tbody")
-            # Find all links within the tbody
-            links = tbody.find_elements(By.TAG_NAME, "a")
+            # Collect every href in one round trip instead of one call per link
+            hrefs = self.driver.execute_script(EXTRACT_REPORT_URLS_JS) or []
+            urls = [url for url in hrefs if url]
 
-            for link in links:
-                url = link.get_attribute("href")
-                if url:
-                    urls.append(url)
-                    logger.info(f"Found report URL: {url}")
+            if logger.isEnabledFor(logging.DEBUG):
+                for url in urls:
+                    logger.debug(f"Found report URL: {url}")
 
             logger.info(f"Extracted {len(urls)} report URLs")
             return urls
@@ -236,56 +894,56 @@ class SenateScraper:
             logger.error(f"Error extracting report URLs: {str(e)}")
             return []
 
-    def process_single_report(self, url: str) -> Optional[Dict[str, Any]]:
+    async def fetch_reports(self, urls: List[str]) -> List[Optional[bytes]]:
+        """
+        Fetch report pages concurrently over HTTP, reusing the browser's session cookies.
+
+        Args:
+            urls (List[str]): List of report URLs to fetch
+
+        Returns:
+            List[Optional[bytes]]: Raw page HTML for each URL, in order, or None where the fetch failed
+        """
+        # Carry the agreement/session cookies over from Selenium
+        cookies = {
+            cookie["name"]: cookie["value"] for cookie in self.driver.get_cookies()
+        }
+        pages = await self._fetch_pages(urls, cookies)
+        return [page[2] if page else None for page in pages]
+
+    def process_single_report(
+        self, url: str, timestamp: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Process a single report URL and extract relevant information.
 
         Args:
             url (str): URL of the report to process
+            timestamp (Optional[str]): ISO timestamp to record on the report. Defaults to now.
 
         Returns:
             Optional[Dict[str, Any]]: Dictionary containing extracted information or None if extraction fails
         """
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException
+
         try:
             logger.info(f"Processing report at URL: {url}")
             self.driver.get(url)
 
-            # Wait for the page to load
-            time.sleep(3)
-
-            # Extract basic information
-            report_data = {
-                "url": url,
-                "timestamp": datetime.now().isoformat(),
-                "transactions": [],
-            }
-
             # Wait for and extract the transactions table
             table = WebDriverWait(self.driver, TIMEOUT).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "table.table"))
+                EC.presence_of_element_located(TABLE_LOC)
             )
 
-            # Extract table rows (skip header row)
-            rows = table.find_elements(By.TAG_NAME, "tr")[1:]
-
-            for row in rows:
-                cells = row.find_elements(By.TAG_NAME, "td")
-                if len(cells) >= 9:  # Ensure we have all columns
-                    transaction = {
-                        "number": cells[0].text.strip(),
-                        "transaction_date": cells[1].text.strip(),
-                        "owner": cells[2].text.strip(),
-                        "ticker": cells[3].text.strip(),
-                        "asset_name": cells[4].text.strip(),
-                        "asset_type": cells[5].text.strip(),
-                        "type": cells[6].text.strip(),
-                        "amount": cells[7].text.strip(),
-                        "comment": cells[8].text.strip(),
-                    }
-                    report_data["transactions"].append(transaction)
-                    logger.info(f"Extracted transaction: {transaction}")
-
-            return report_data
+            if self.parse_page_source:
+                # Fetch the HTML once and parse it locally, without injecting scripts
+                return self._parse_report(url, self.driver.page_source, timestamp)
+
+            # Stop loading and read every cell in one round trip
+            rows = self.driver.execute_script(EXTRACT_TABLE_CELLS_JS, table) or []
+            return self._build_report(url, rows, timestamp)
 
         except TimeoutException:
             logger.error(f"Timeout while processing report at {url}")
@@ -294,114 +952,574 @@ class SenateScraper:
             logger.error(f"Error processing report at {url}: {str(e)}")
             return None
 
-    def process_all_reports(self, report_urls: List[str]) -> List[Dict[str, Any]]:
+    def process_all_reports(
+        self, report_urls: List[str], ndjson_file: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """
-        Process all report URLs and collect their information.
+        Process all report URLs in parallel, one headless browser per worker process.
+
+        WebDriver is not thread-safe, so each worker process runs its own scraper.
+        Falls back to processing sequentially in this browser for a single URL,
+        a single worker, or the reports left over if the worker pool breaks.
 
         Args:
             report_urls (List[str]): List of report URLs to process
+            ndjson_file (Optional[str]): File to append each report to as one JSON line as soon as it is processed
 
         Returns:
             List[Dict[str, Any]]: List of dictionaries containing extracted information
         """
-        all_reports = []
+        workers = min(self.report_workers, len(report_urls))
+        if workers <= 1:
+            return super().process_all_reports(report_urls, ndjson_file)
+
+        import multiprocessing
+        import itertools
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+
+        logger.info(f"Processing {len(report_urls)} reports with {workers} workers")
+        started = multiprocessing.Value("i", 0)
+        reports = []
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_report_worker,
+                initargs=(started, self.profile_dir, self.parse_page_source),
+            ) as executor:
+                results = executor.map(
+                    _process_report_in_worker,
+                    report_urls,
+                    itertools.repeat(datetime.now().isoformat()),
+                )
+                return self._collect_reports(results, reports, ndjson_file)
 
-        for i, url in enumerate(report_urls, 1):
-            logger.info(f"Processing report {i} of {len(report_urls)}: {url}")
-            report_data = self.process_single_report(url)
-            if report_data:
-                all_reports.append(report_data)
+        except BrokenProcessPool as e:
+            logger.error(
+                f"Report worker pool failed, processing sequentially: {str(e)}"
+            )
+            done = {report_data["url"] for report_data in reports}
+            remaining = [url for url in report_urls if url not in done]
+            return reports + super().process_all_reports(remaining, ndjson_file)
+
+    def cleanup(self) -> None:
+        """Clean up resources."""
+        logger.info("Cleaning up resources...")
+        # Safe to call more than once; the driver is only quit the first time
+        if getattr(self, "driver", None) is not None:
+            self.driver.quit()
+            self.driver = None
+
+
+# Scraper owned by the current report worker process
+_worker_scraper: Optional[SenateScraper] = None
+
+
+def _init_report_worker(
+    started: "multiprocessing.sharedctypes.Synchronized",
+    profile_dir: Optional[str],
+    parse_page_source: bool = False,
+) -> None:
+    """
+    Start the worker process's own headless scraper and seed its session cookies.
+
+    Args:
+        started (multiprocessing.sharedctypes.Synchronized): Count of workers started so far
+        profile_dir (Optional[str]): Parent's Chrome profile directory, overridden by one in CHROME_OPTIONS; each worker uses its own numbered copy
+        parse_page_source (bool): Whether to parse report tables from the page HTML
+    """
+    from multiprocessing.util import Finalize
+
+    global _worker_scraper
+
+    with started.get_lock():
+        index = started.value
+        started.value += 1
+    time.sleep(index * WORKER_STAGGER_SECONDS)
+
+    # Chrome cannot share a profile between running browsers, so a profile set in
+    # CHROME_OPTIONS is numbered per worker too rather than taking precedence
+    chrome_options = os.getenv("CHROME_OPTIONS", "").split()
+    env_profile_dirs = [
+        option.split("=", 1)[1]
+        for option in chrome_options
+        if option.startswith("--user-data-dir=")
+    ]
+    if env_profile_dirs:
+        profile_dir = env_profile_dirs[-1]
+        os.environ["CHROME_OPTIONS"] = " ".join(
+            option
+            for option in chrome_options
+            if not option.startswith("--user-data-dir")
+        )
+    worker_profile_dir = f"{profile_dir}-worker-{index}" if profile_dir else None
+    _worker_scraper = SenateScraper(
+        headless=True,
+        report_workers=1,
+        profile_dir=worker_profile_dir,
+        parse_page_source=parse_page_source,
+    )
+    # Worker processes skip atexit handlers, so quit the browser via a finalizer
+    Finalize(None, _worker_scraper.cleanup, exitpriority=10)
+    if not (
+        _worker_scraper.navigate_to_search() and _worker_scraper.accept_agreement()
+    ):
+        logger.error("Report worker failed to accept the agreement")
 
-        return all_reports
 
-    def save_reports_to_json(
-        self, reports: List[Dict[str, Any]], filename: str = None
-    ) -> Optional[str]:
+def _process_report_in_worker(
+    url: str, timestamp: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Process a single report with the worker process's scraper.
+
+    Args:
+        url (str): URL of the report to process
+        timestamp (Optional[str]): ISO timestamp to record on the report. Defaults to now.
+
+    Returns:
+        Optional[Dict[str, Any]]: Dictionary containing extracted information or None if extraction fails
+    """
+    return _worker_scraper.process_single_report(url, timestamp)
+
+
+class SenateHttpScraper(BaseScraper):
+    """A class to scrape financial disclosure data from the Senate website over plain HTTP."""
+
+    def __init__(
+        self,
+        email_client: Optional[EmailClient] = None,
+        report_cache: Optional[ReportCache] = None,
+    ):
         """
-        Save the collected reports to a JSON file with the current date.
+        Initialize the scraper with configuration.
 
         Args:
-            reports (List[Dict[str, Any]]): List of report dictionaries to save
-            filename (str, optional): Name of the output JSON file. If None, generates with date
+            email_client (Optional[EmailClient]): EmailClient instance for notifications
+            report_cache (Optional[ReportCache]): Cache of parsed reports used for conditional requests
+        """
+        logger.info("Initializing SenateHttpScraper...")
+        super().__init__(email_client)
+        self.report_cache = report_cache
+        self.session = self._setup_session()
+        self.csrf_token: Optional[str] = None
+
+    @staticmethod
+    def _setup_session() -> "requests.Session":
+        """
+        Set up an HTTP session that keeps connections alive and retries transient failures.
 
         Returns:
-            Optional[str]: Path to the saved file if successful, None otherwise
+            requests.Session: Configured session shared by every request of the scraper
         """
-        if filename is None:
-            today = datetime.now().strftime("%Y-%m-%d")
-            filename = f"senate_reports_{today}.json"
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=MAX_CONCURRENT_FETCHES,
+            pool_maxsize=MAX_CONCURRENT_FETCHES,
+            max_retries=Retry(
+                total=HTTP_RETRIES,
+                backoff_factor=HTTP_RETRY_BACKOFF_SECONDS,
+                status_forcelist=HTTP_RETRY_STATUSES,
+            ),
+        )
+        session.mount("https://", adapter)
+        session.headers.update(
+            {"User-Agent": USER_AGENT, "Accept-Encoding": "gzip, deflate"}
+        )
+        return session
+
+    @staticmethod
+    def _check_response(response: "requests.Response") -> None:
+        """
+        Raise for unsuccessful responses.
+
+        Args:
+            response (requests.Response): Response to check
+
+        Raises:
+            EFDAccessDeniedError: If the site refused the request with HTTP 403
+            requests.HTTPError: For any other unsuccessful status
+        """
+        if response.status_code == 403:
+            raise EFDAccessDeniedError(f"Access denied by {response.url}")
+        response.raise_for_status()
+
+    def find_report_urls(self) -> Optional[List[str]]:
+        """
+        Accept the agreement and search for today's reports.
+
+        Returns:
+            Optional[List[str]]: Report URLs found, or None if the search could not be run
+        """
+        if not self.accept_agreement():
+            return None
+        return self.search_report_urls()
+
+    def accept_agreement(self) -> bool:
+        """
+        Accept the agreement by posting the agreement form with its CSRF token.
+
+        Returns:
+            bool: True if agreement was accepted successfully, False otherwise
+
+        Raises:
+            EFDAccessDeniedError: If the site refuses plain HTTP access
+        """
+        import requests
+        from lxml import html
+
         try:
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(reports, f, indent=2, ensure_ascii=False)
-            logger.info(f"Successfully saved reports to {filename}")
-            return filename
-        except Exception as e:
-            logger.error(f"Error saving reports to JSON: {str(e)}")
+            logger.info(f"Requesting agreement page {HOME_URL}")
+            response = self.session.get(HOME_URL, timeout=TIMEOUT)
+            self._check_response(response)
+
+            tokens = html.fromstring(response.content).xpath(
+                "//input[@name='csrfmiddlewaretoken']/@value"
+            )
+            if not tokens:
+                logger.error("CSRF token not found on agreement page")
+                return False
+
+            response = self.session.post(
+                HOME_URL,
+                data={"csrfmiddlewaretoken": tokens[0], "prohibition_agreement": "1"},
+                headers={"Referer": HOME_URL},
+                timeout=TIMEOUT,
+            )
+            self._check_response(response)
+
+            # Prefer the session cookie, which the site may rotate after the agreement
+            self.csrf_token = self.session.cookies.get("csrftoken", tokens[0])
+            logger.info("Successfully accepted agreement")
+            return True
+
+        except requests.RequestException as e:
+            logger.error(f"Error accepting agreement: {str(e)}")
+            return False
+
+    def search_report_urls(
+        self, from_date: Optional[str] = None
+    ) -> Optional[List[str]]:
+        """
+        Query the report search endpoint for periodic transaction reports.
+
+        Args:
+            from_date (Optional[str]): Earliest submission date as MM/DD/YYYY. Defaults to today
+
+        Returns:
+            Optional[List[str]]: Report URLs found, or None if the search failed
+
+        Raises:
+            EFDAccessDeniedError: If the site refuses plain HTTP access
+        """
+        import requests
+
+        from_date = from_date or datetime.now().strftime("%m/%d/%Y")
+        try:
+            logger.info(f"Searching for reports submitted since {from_date}")
+            urls = []
+            start = 0
+            while True:
+                response = self.session.post(
+                    REPORT_DATA_URL,
+                    data={
+                        **_report_search_form(from_date, start),
+                        "csrfmiddlewaretoken": self.csrf_token,
+                    },
+                    headers={"Referer": BASE_URL},
+                    timeout=TIMEOUT,
+                )
+                self._check_response(response)
+                rows = response.json()["data"]
+                urls.extend(_report_urls_from_rows(rows))
+
+                if len(rows) < REPORT_PAGE_SIZE:
+                    break
+                start += REPORT_PAGE_SIZE
+
+            logger.info(f"Extracted {len(urls)} report URLs")
+            return urls
+
+        except requests.RequestException as e:
+            logger.error(f"Error searching for reports: {str(e)}")
+            return None
+        except (ValueError, KeyError, IndexError) as e:
+            logger.error(f"Unexpected report search response: {str(e)}")
+            return None
+
+    def process_single_report(
+        self, url: str, timestamp: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Process a single report URL and extract relevant information.
+
+        Args:
+            url (str): URL of the report to process
+            timestamp (Optional[str]): ISO timestamp to record on the report. Defaults to now.
+
+        Returns:
+            Optional[Dict[str, Any]]: Dictionary containing extracted information or None if extraction fails
+        """
+        import requests
+
+        try:
+            logger.info(f"Processing report at URL: {url}")
+            response = self.session.get(
+                url, headers=self._conditional_headers(url), timeout=TIMEOUT
+            )
+            response.raise_for_status()
+            return self._report_from_response(
+                url, response.status_code, response.headers, response.content, timestamp
+            )
+
+        except requests.RequestException as e:
+            logger.error(f"Error processing report at {url}: {str(e)}")
             return None
 
+    def process_all_reports(
+        self, report_urls: List[str], ndjson_file: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch all report pages concurrently over HTTP and extract their information.
+
+        Args:
+            report_urls (List[str]): List of report URLs to process
+            ndjson_file (Optional[str]): File to append each report to as one JSON line as soon as it is processed
+
+        Returns:
+            List[Dict[str, Any]]: List of dictionaries containing extracted information
+        """
+        import asyncio
+
+        if len(report_urls) <= 1:
+            return super().process_all_reports(report_urls, ndjson_file)
+
+        return asyncio.run(self._fetch_and_collect_reports(report_urls, ndjson_file))
+
+    async def _fetch_and_collect_reports(
+        self, report_urls: List[str], ndjson_file: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch report pages concurrently, extracting and writing each one as it arrives.
+
+        Args:
+            report_urls (List[str]): List of report URLs to process
+            ndjson_file (Optional[str]): File to append each report to as one JSON line as soon as it is processed
+
+        Returns:
+            List[Dict[str, Any]]: Extracted reports, in the order of report_urls
+        """
+        import asyncio
+
+        timestamp = datetime.now().isoformat()
+        cookies = {cookie.name: cookie.value for cookie in self.session.cookies}
+
+        async def fetch(session, url):
+            return url, await self._fetch_report(
+                session, url, self._conditional_headers(url)
+            )
+
+        logger.info(f"Fetching {len(report_urls)} reports over HTTP")
+        reports = []
+        with self._ndjson_writer(ndjson_file) as write:
+            async with self._client_session(
+                cookies, headers={"User-Agent": USER_AGENT}
+            ) as session:
+                for fetched in asyncio.as_completed(
+                    [fetch(session, url) for url in report_urls]
+                ):
+                    url, page = await fetched
+                    if page is None:
+                        continue
+                    try:
+                        report_data = self._report_from_response(url, *page, timestamp)
+                    except Exception as e:
+                        # One bad page costs its report, not the run
+                        logger.error(f"Error processing report at {url}: {str(e)}")
+                        continue
+                    if report_data:
+                        reports.append(report_data)
+                        write(report_data)
+
+        # Pages complete in any order; keep the saved JSON in search-result order
+        order = {url: i for i, url in enumerate(report_urls)}
+        reports.sort(key=lambda report_data: order[report_data["url"]])
+        return reports
+
+    def _conditional_headers(self, url: str) -> Dict[str, str]:
+        """
+        Build the conditional request headers for a report cached from an earlier run.
+
+        Args:
+            url (str): URL of the report
+
+        Returns:
+            Dict[str, str]: Conditional request headers, empty if there is no cached copy
+        """
+        if self.report_cache is None:
+            return {}
+        return self.report_cache.conditional_headers(url)
+
+    def _report_from_response(
+        self,
+        url: str,
+        status: int,
+        headers: Mapping[str, str],
+        content: Union[str, bytes],
+        timestamp: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Turn a report page response into a report, reusing the cached one if unchanged.
+
+        Args:
+            url (str): URL of the report
+            status (int): HTTP status of the response
+            headers (Mapping[str, str]): Response headers
+            content (Union[str, bytes]): Response body
+            timestamp (Optional[str]): ISO timestamp to record on the report. Defaults to now.
+
+        Returns:
+            Optional[Dict[str, Any]]: Dictionary containing extracted information or None if extraction fails
+        """
+        if status == 304 and self.report_cache is not None:
+            cached = self.report_cache.get(url)
+            if cached is not None:
+                logger.info(
+                    f"Report at {url} not modified, reusing cached transactions"
+                )
+                cached["timestamp"] = timestamp or datetime.now().isoformat()
+                return cached
+
+        report_data = self._parse_report(url, content, timestamp)
+        if report_data and self.report_cache is not None:
+            self.report_cache.put(url, headers, report_data)
+        return report_data
+
     def cleanup(self) -> None:
         """Clean up resources."""
         logger.info("Cleaning up resources...")
-        if hasattr(self, "driver"):
-            self.driver.quit()
-
-    def __enter__(self):
-        """Context manager entry."""
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
-        self.cleanup()
-        if exc_type is not None:
-            logger.error(f"Error occurred: {str(exc_val)}")
-            return False
-        return True
+        self.session.close()
+
+
+def run_scraper(
+    scraper: BaseScraper,
+    seen_urls: Optional[SeenUrlStore] = None,
+    force: bool = False,
+    columnar: bool = False,
+) -> None:
+    """
+    Find today's reports, process them, save them and send the result notification.
+
+    Args:
+        scraper (BaseScraper): Scraper to run
+        seen_urls (Optional[SeenUrlStore]): Store of already processed report URLs to skip and update
+        force (bool): Whether to process reports again even if they were already seen
+        columnar (bool): Whether to write each report's transactions as one list per field in the JSON file
+    """
+    report_urls = scraper.find_report_urls()
+    if report_urls is None:
+        return
+
+    if seen_urls is not None and not force:
+        new_urls = seen_urls.filter_new(report_urls)
+        if len(new_urls) < len(report_urls):
+            logger.info(
+                f"Skipping {len(report_urls) - len(new_urls)} already processed reports"
+            )
+        if report_urls and not new_urls:
+            # An earlier run already processed and reported every one of them
+            logger.info("No new reports since the last run")
+            return
+        report_urls = new_urls
+
+    today = datetime.now().strftime("%Y-%m-%d")
+    # Process and send notification only for success/failure of report processing;
+    # each report is also appended to the day's NDJSON file as soon as it is done
+    all_reports = (
+        scraper.process_all_reports(
+            report_urls, ndjson_file=f"senate_reports_{today}.ndjson"
+        )
+        if report_urls
+        else []
+    )
+
+    if all_reports:
+        # Save reports and get the filename
+        report_file = scraper.save_reports_to_json(all_reports, columnar=columnar)
+        if report_file:
+            if seen_urls is not None:
+                seen_urls.add(report["url"] for report in all_reports)
+            message = f"Successfully completed report processing. Processed {len(all_reports)} reports."
+            logger.info(message)
+            scraper.send_notification(
+                subject=f"Senate Report {today} - Success",
+                body=message,
+                attachments=[report_file],
+            )
+    else:
+        message = "No reports were successfully processed"
+        logger.error(message)
+        scraper.send_notification(
+            subject=f"Senate Report {today} - No Reports", body=message
+        )
 
 
 if __name__ == "__main__":
+    import argparse
+    from dotenv import load_dotenv
+
+    parser = argparse.ArgumentParser(
+        description="Scrape today's Senate periodic transaction reports."
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="process reports again even if they were already processed",
+    )
+    parser.add_argument(
+        "--columnar",
+        action="store_true",
+        help="write each report's transactions as one list per field in the JSON file",
+    )
+    args = parser.parse_args()
+
+    # Load environment variables
+    load_dotenv()
+
+    email_client = None
+    seen_urls = SeenUrlStore(os.getenv("SEEN_URLS_DB", SEEN_URLS_DB))
+    report_cache = ReportCache(os.getenv("REPORT_CACHE_DB", REPORT_CACHE_DB))
     try:
         # Initialize email client
-        email = os.getenv("GMAIL_EMAIL")
-        password = os.getenv("GMAIL_PASSWORD")
-
-        if not email or not password:
+        if not os.getenv("GMAIL_EMAIL") or not os.getenv("GMAIL_PASSWORD"):
             logger.warning(
                 "Email credentials not found. Running without email notifications."
             )
-            email_client = None
         else:
-            email_client = EmailClient(email=email, password=password)
-
-        with SenateScraper(headless=False, email_client=email_client) as scraper:
-            if scraper.navigate_to_search() and scraper.accept_agreement():
-                logger.info("Successfully initialized search page")
-                if scraper.fill_search_form():
-                    logger.info("Successfully submitted search form")
-                    # Process and send notification only for success/failure of report processing
-                    # Extract report URLs if results exist
-                    report_urls = scraper.extract_report_urls()
-                    all_reports = (
-                        scraper.process_all_reports(report_urls) if report_urls else []
-                    )
+            email_client = EmailClient.from_env()
 
-                    today = datetime.now().strftime("%Y-%m-%d")
-                    if all_reports:
-                        # Save reports and get the filename
-                        report_file = scraper.save_reports_to_json(all_reports)
-                        if report_file:
-                            message = f"Successfully completed report processing. Processed {len(all_reports)} reports."
-                            logger.info(message)
-                            scraper.send_notification(
-                                subject=f"Senate Report {today} - Success",
-                                body=message,
-                                attachments=[report_file],
-                            )
-                    else:
-                        message = "No reports were successfully processed"
-                        logger.error(message)
-                        scraper.send_notification(
-                            subject=f"Senate Report {today} - No Reports", body=message
-                        )
+        try:
+            with SenateHttpScraper(
+                email_client=email_client, report_cache=report_cache
+            ) as scraper:
+                run_scraper(
+                    scraper, seen_urls, force=args.force, columnar=args.columnar
+                )
+        except EFDAccessDeniedError as e:
+            # Fall back to a real browser only when plain HTTP is refused
+            logger.warning(f"{e}; falling back to Selenium")
+            with SenateScraper(
+                headless=False,
+                email_client=email_client,
+                profile_dir=os.getenv("CHROME_PROFILE_DIR", PERSISTENT_PROFILE_DIR),
+            ) as scraper:
+                run_scraper(
+                    scraper, seen_urls, force=args.force, columnar=args.columnar
+                )
 
     except Exception as e:
         error_message = f"An error occurred: {str(e)}"
@@ -411,3 +1529,8 @@ if __name__ == "__main__":
                 subject="Error - Unexpected Exception", body=error_message
             )
         exit(1)
+    finally:
+        seen_urls.close()
+        report_cache.close()
+        if email_client:
+            email_client.close()
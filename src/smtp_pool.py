@@ -0,0 +1,141 @@
+import queue
+import smtplib
+import logging
+import threading
+from typing import Callable, Dict
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class SMTPConnectionPool:
+    """
+    A bounded pool of authenticated SMTP sessions for a single server and account.
+
+    Idle sessions are reused across sends, concurrent users are capped at
+    ``max_connections`` and each session is recycled after
+    ``max_messages_per_connection`` messages.
+
+    Attributes:
+        max_connections (int): Maximum number of SMTP sessions open at once.
+        max_messages_per_connection (int): Messages sent before a session is recycled.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], smtplib.SMTP],
+        max_connections: int = 5,
+        max_messages_per_connection: int = 100,
+    ):
+        """
+        Initialize the SMTPConnectionPool.
+
+        Args:
+            connect (Callable[[], smtplib.SMTP]): Factory returning a new authenticated SMTP session.
+            max_connections (int, optional): Maximum number of SMTP sessions open at once. Defaults to 5.
+            max_messages_per_connection (int, optional): Messages sent before a session is recycled. Defaults to 100.
+        """
+        self._connect = connect
+        self.max_connections = max_connections
+        self.max_messages_per_connection = max_messages_per_connection
+        self._idle: "queue.Queue[smtplib.SMTP]" = queue.Queue()
+        self._slots = threading.Semaphore(max_connections)
+        self._message_counts: Dict[smtplib.SMTP, int] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _is_healthy(conn: smtplib.SMTP) -> bool:
+        """
+        Check whether an SMTP session is still usable.
+
+        Args:
+            conn (smtplib.SMTP): The session to check.
+
+        Returns:
+            bool: True if the session answers NOOP, False otherwise.
+        """
+        try:
+            return conn.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def _discard(self, conn: smtplib.SMTP, graceful: bool = True) -> None:
+        """
+        Close an SMTP session and forget about it.
+
+        Args:
+            conn (smtplib.SMTP): The session to close.
+            graceful (bool, optional): Whether to send QUIT first. Defaults to True.
+        """
+        with self._lock:
+            self._message_counts.pop(conn, None)
+        try:
+            if graceful:
+                conn.quit()
+            else:
+                conn.close()
+        except (smtplib.SMTPException, OSError) as e:
+            logger.warning(f"Error closing SMTP connection: {e}")
+
+    def acquire(self) -> smtplib.SMTP:
+        """
+        Check out an authenticated SMTP session, blocking while the pool is at capacity.
+
+        Returns:
+            smtplib.SMTP: An authenticated SMTP session.
+        """
+        self._slots.acquire()
+        try:
+            while True:
+                try:
+                    conn = self._idle.get_nowait()
+                except queue.Empty:
+                    break
+                if self._is_healthy(conn):
+                    return conn
+                # It did not answer NOOP, so it would not answer QUIT either
+                self._discard(conn, graceful=False)
+
+            conn = self._connect()
+            with self._lock:
+                self._message_counts[conn] = 0
+            return conn
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, conn: smtplib.SMTP, broken: bool = False) -> None:
+        """
+        Return a session to the pool after one send attempt.
+
+        The session is closed instead of being kept when it is broken or has
+        reached the per-connection message limit. A broken session is closed
+        without QUIT, since it may have failed mid-DATA and the server would
+        never answer.
+
+        Args:
+            conn (smtplib.SMTP): The session returned by ``acquire``.
+            broken (bool, optional): Whether the send attempt failed. Defaults to False.
+        """
+        try:
+            with self._lock:
+                count = self._message_counts.get(conn, 0) + 1
+                self._message_counts[conn] = count
+            if broken:
+                self._discard(conn, graceful=False)
+            elif count >= self.max_messages_per_connection:
+                self._discard(conn)
+            else:
+                self._idle.put(conn)
+        finally:
+            self._slots.release()
+
+    def close_all(self) -> None:
+        """Close every idle session held by the pool."""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
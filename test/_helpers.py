@@ -0,0 +1,9 @@
+def fresh(mock):
+    """Reset a shared spec mock, including configured return values and side effects."""
+    mock.reset_mock(return_value=True, side_effect=True)
+    return mock
+
+
+def written(mocked_open):
+    """Join everything written through a mock_open handle."""
+    return b"".join(c.args[0] for c in mocked_open().write.call_args_list)
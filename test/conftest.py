@@ -1,6 +1,33 @@
 import pytest
 import os
 import sys
+from unittest.mock import patch
 
 # Add the src directory to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+
+@pytest.fixture(scope="session")
+def chrome_driver_cls():
+    """Patch selenium.webdriver.Chrome once for the whole test session."""
+    with patch("selenium.webdriver.Chrome") as mock_chrome:
+        yield mock_chrome
+
+
+@pytest.fixture(scope="session")
+def _shared_scraper(chrome_driver_cls):
+    """Build one SenateScraper on the patched driver and snapshot its initial state."""
+    from src.senate_scraper import SenateScraper
+
+    scraper = SenateScraper(headless=True)
+    return scraper, dict(scraper.__dict__)
+
+
+@pytest.fixture
+def scraper(chrome_driver_cls, _shared_scraper):
+    """Restore the shared SenateScraper and give it a fresh driver mock."""
+    scraper, initial_state = _shared_scraper
+    chrome_driver_cls.reset_mock(return_value=True, side_effect=True)
+    scraper.__dict__.update(initial_state)
+    scraper.driver = chrome_driver_cls.return_value
+    return scraper
@@ -1,101 +1,384 @@
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, Mock, mock_open, call, ANY
 import os
+import io
+import email
+from email.policy import SMTP
 from src.email_client import EmailClient
 import smtplib
+import ssl
+from types import MappingProxyType
+from test._helpers import fresh
+
+# The real class, for specs while smtplib.SMTP is patched
+SMTP_CLASS = smtplib.SMTP
+# Spec'd SMTP session shared by the tests; fresh() clears it between them
+_SMTP_SPEC = Mock(spec=SMTP_CLASS)
+# Recipient, subject and body shared by the single-message send tests
+_EMAIL_KW = MappingProxyType(
+    {
+        "to_emails": ["recipient@example.com"],
+        "subject": "Test Subject",
+        "body": "Test Body",
+    }
+)
 
 
 class TestEmailClient(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Patch smtplib.SMTP once for the whole class."""
+        cls._smtp_patcher = patch("smtplib.SMTP")
+        cls.mock_smtp = cls._smtp_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up after tests."""
+        cls._smtp_patcher.stop()
+
     def setUp(self):
         """Set up test cases."""
+        self.mock_smtp.reset_mock(return_value=True, side_effect=True)
         self.email = "test@example.com"
         self.password = "test_password"
         self.client = EmailClient(self.email, self.password)
 
+    @staticmethod
+    def _streaming_smtp_instance():
+        """Create a mock SMTP session that accepts a streamed DATA transaction."""
+        mock_smtp_instance = fresh(_SMTP_SPEC)
+        mock_smtp_instance.mail.return_value = (250, b"OK")
+        mock_smtp_instance.rcpt.return_value = (250, b"OK")
+        mock_smtp_instance.getreply.side_effect = [(354, b"Go ahead"), (250, b"OK")]
+        return mock_smtp_instance
+
+    @staticmethod
+    def _sent_message(mock_smtp_instance):
+        """Reassemble and parse the message streamed through a mock SMTP session."""
+        data = b"".join(c.args[0] for c in mock_smtp_instance.send.call_args_list)
+        assert data.endswith(b"\r\n.\r\n")
+        data = data[: -len(b".\r\n")].replace(b"\r\n..", b"\r\n.")
+        return email.message_from_bytes(data)
+
     def test_init(self):
         """Test EmailClient initialization."""
         self.assertEqual(self.client.email, self.email)
         self.assertEqual(self.client.password, self.password)
         self.assertEqual(self.client.smtp_server, "smtp.gmail.com")
         self.assertEqual(self.client.smtp_port, 587)
+        self.assertEqual(self.client.max_messages_per_connection, 100)
+        self.assertEqual(self.client.timeout, 30)
+
+    @patch("dotenv.load_dotenv")
+    def test_from_env(self, mock_load_dotenv):
+        """Test creating a client from environment variables."""
+        env = {"GMAIL_EMAIL": self.email, "GMAIL_PASSWORD": self.password}
+        with patch.dict(os.environ, env):
+            client = EmailClient.from_env(smtp_port=2525)
+
+        mock_load_dotenv.assert_called_once()
+        self.assertEqual(client.email, self.email)
+        self.assertEqual(client.password, self.password)
+        self.assertEqual(client.smtp_port, 2525)
 
-    @patch("smtplib.SMTP")
-    def test_send_email_success(self, mock_smtp):
+    @patch("dotenv.load_dotenv")
+    def test_from_env_missing_credentials(self, mock_load_dotenv):
+        """Test creating a client without credentials in the environment."""
+        with patch.dict(os.environ, {}, clear=True):
+            with self.assertRaises(ValueError):
+                EmailClient.from_env()
+
+    def test_send_email_success(self):
         """Test successful email sending."""
         # Setup
-        mock_smtp_instance = MagicMock()
-        mock_smtp.return_value.__enter__.return_value = mock_smtp_instance
+        mock_smtp_instance = fresh(_SMTP_SPEC)
+        self.mock_smtp.return_value = mock_smtp_instance
 
         # Test
-        result = self.client.send_email(
-            to_emails=["recipient@example.com"],
-            subject="Test Subject",
-            body="Test Body",
-        )
+        result = self.client.send_email(**_EMAIL_KW)
 
         # Assert
         self.assertTrue(result)
-        mock_smtp_instance.starttls.assert_called_once()
-        mock_smtp_instance.login.assert_called_once_with(self.email, self.password)
-        mock_smtp_instance.sendmail.assert_called_once()
+        self.assertEqual(
+            mock_smtp_instance.mock_calls,
+            [
+                call.starttls(context=self.client._ssl_context),
+                call.login(self.email, self.password),
+                call.send_message(
+                    ANY, from_addr=self.email, to_addrs=["recipient@example.com"]
+                ),
+            ],
+        )
+        msg = mock_smtp_instance.send_message.call_args.args[0]
+        self.assertIs(msg.policy, SMTP)
+
+    def test_connect_caches_tls_session(self):
+        """Test that the session connects with a timeout and STARTTLS caches its TLS session."""
+        # Setup
+        mock_smtp_instance = fresh(_SMTP_SPEC)
+        self.mock_smtp.return_value = mock_smtp_instance
+
+        # Test
+        self.client.send_email(**_EMAIL_KW)
+
+        # Assert
+        self.mock_smtp.assert_called_once_with(
+            "smtp.gmail.com", 587, timeout=self.client.timeout
+        )
+        mock_smtp_instance.starttls.assert_called_once_with(
+            context=self.client._ssl_context
+        )
+        self.assertIs(self.client._ssl_context.session, mock_smtp_instance.sock.session)
+
+    def test_ssl_context_offers_cached_session(self):
+        """Test that wrapping a socket offers the cached TLS session."""
+        cached_session = MagicMock()
+        self.client._ssl_context.session = cached_session
+
+        with patch.object(ssl.SSLContext, "wrap_socket") as mock_wrap_socket:
+            self.client._ssl_context.wrap_socket(
+                "sock", server_hostname="smtp.gmail.com"
+            )
+
+        mock_wrap_socket.assert_called_once_with(
+            "sock",
+            server_hostname="smtp.gmail.com",
+            session=cached_session,
+        )
 
-    @patch("smtplib.SMTP")
-    def test_send_email_with_attachment(self, mock_smtp):
+    def test_send_email_with_attachment(self):
         """Test email sending with attachment."""
-        # Create a temporary test file
+        # Setup
         test_file = "test_attachment.txt"
-        with open(test_file, "w") as f:
-            f.write("Test content")
-
-        try:
-            # Setup
-            mock_smtp_instance = MagicMock()
-            mock_smtp.return_value.__enter__.return_value = mock_smtp_instance
+        mock_smtp_instance = self._streaming_smtp_instance()
+        self.mock_smtp.return_value = mock_smtp_instance
 
-            # Test
+        # Test
+        with patch(
+            "src.email_client.open", mock_open(read_data=b"Test content"), create=True
+        ) as mocked_open:
             result = self.client.send_email(
-                to_emails=["recipient@example.com"],
-                subject="Test Subject",
-                body="Test Body",
+                **_EMAIL_KW,
                 attachments=[test_file],
             )
 
-            # Assert
-            self.assertTrue(result)
-            mock_smtp_instance.sendmail.assert_called_once()
-
-        finally:
-            # Cleanup
-            if os.path.exists(test_file):
-                os.remove(test_file)
+        # Assert
+        self.assertTrue(result)
+        mocked_open.assert_called_once_with(test_file, "rb")
+        mock_smtp_instance.mail.assert_called_once_with(self.email)
+        mock_smtp_instance.rcpt.assert_called_once_with("recipient@example.com")
+        message = self._sent_message(mock_smtp_instance)
+        attachment = message.get_payload()[1]
+        self.assertEqual(attachment.get_filename(), test_file)
+        self.assertEqual(attachment.get_payload(decode=True), b"Test content")
 
-    @patch("smtplib.SMTP")
-    def test_send_email_smtp_error(self, mock_smtp):
-        """Test email sending with SMTP error."""
+    def test_send_email_with_stream_attachment(self):
+        """Test email sending with an in-memory stream spanning several chunks."""
         # Setup
-        mock_smtp_instance = MagicMock()
-        mock_smtp_instance.sendmail.side_effect = smtplib.SMTPException("Test error")
-        mock_smtp.return_value.__enter__.return_value = mock_smtp_instance
+        mock_smtp_instance = self._streaming_smtp_instance()
+        self.mock_smtp.return_value = mock_smtp_instance
+        content = bytes(range(256)) * 1000
+        stream = io.BytesIO(content)
 
         # Test
         result = self.client.send_email(
             to_emails=["recipient@example.com"],
             subject="Test Subject",
-            body="Test Body",
+            body=".Test Body",
+            attachments=[stream],
         )
 
         # Assert
-        self.assertFalse(result)
+        self.assertTrue(result)
+        self.assertFalse(stream.closed)
+        message = self._sent_message(mock_smtp_instance)
+        body, attachment = message.get_payload()
+        self.assertEqual(body.get_payload(), ".Test Body")
+        self.assertEqual(attachment.get_payload(decode=True), content)
 
-    def test_send_email_invalid_attachment(self):
-        """Test email sending with invalid attachment."""
+    def test_send_email_with_attachment_data_rejected(self):
+        """Test email sending with an attachment when the server rejects DATA."""
+        # Setup
+        mock_smtp_instance = self._streaming_smtp_instance()
+        mock_smtp_instance.getreply.side_effect = [(554, b"Rejected")]
+        self.mock_smtp.return_value = mock_smtp_instance
+
+        # Test
         result = self.client.send_email(
-            to_emails=["recipient@example.com"],
-            subject="Test Subject",
-            body="Test Body",
-            attachments=["nonexistent_file.txt"],
+            **_EMAIL_KW,
+            attachments=[io.BytesIO(b"Test content")],
         )
+
+        # Assert
+        self.assertFalse(result)
+        mock_smtp_instance.close.assert_called_once()
+        mock_smtp_instance.quit.assert_not_called()
+
+    def test_send_email_with_unreadable_attachment(self):
+        """Test that a stream failing mid-DATA returns False and frees the pool slot."""
+        # Setup
+        mock_smtp_instance = self._streaming_smtp_instance()
+        self.mock_smtp.return_value = mock_smtp_instance
+        client = EmailClient(self.email, self.password, max_connections=1)
+        stream = io.BytesIO(b"Test content")
+        stream.close()
+
+        # Test
+        result = client.send_email(**_EMAIL_KW, attachments=[stream])
+
+        # Assert
+        self.assertFalse(result)
+        # The server is still reading DATA, so QUIT would never be answered
+        mock_smtp_instance.close.assert_called_once()
+        mock_smtp_instance.quit.assert_not_called()
+        self.assertTrue(client._pool._slots.acquire(timeout=1))
+
+    def test_send_email_smtp_error(self):
+        """Test email sending with SMTP error."""
+        # Setup
+        mock_smtp_instance = fresh(_SMTP_SPEC)
+        mock_smtp_instance.send_message.side_effect = smtplib.SMTPException(
+            "Test error"
+        )
+        self.mock_smtp.return_value = mock_smtp_instance
+
+        # Test
+        result = self.client.send_email(**_EMAIL_KW)
+
+        # Assert
+        self.assertFalse(result)
+
+    def test_send_email_connection_error(self):
+        """Test that failing to connect or verify the certificate returns False."""
+        mock_smtp_instance = fresh(_SMTP_SPEC)
+        self.mock_smtp.return_value = mock_smtp_instance
+
+        with self.subTest("refused"):
+            self.mock_smtp.side_effect = ConnectionRefusedError()
+            self.assertFalse(self.client.send_email(**_EMAIL_KW))
+
+        with self.subTest("certificate"):
+            self.mock_smtp.side_effect = None
+            mock_smtp_instance.starttls.side_effect = ssl.SSLCertVerificationError()
+            self.assertFalse(self.client.send_email(**_EMAIL_KW))
+            mock_smtp_instance.close.assert_called_once()
+
+    def test_send_email_reuses_connection(self):
+        """Test that consecutive emails share one SMTP session."""
+        # Setup
+        mock_smtp_instance = fresh(_SMTP_SPEC)
+        mock_smtp_instance.noop.return_value = (250, b"OK")
+        self.mock_smtp.return_value = mock_smtp_instance
+
+        # Test
+        for _ in range(3):
+            self.assertTrue(self.client.send_email(**_EMAIL_KW))
+
+        # Assert
+        self.mock_smtp.assert_called_once()
+        mock_smtp_instance.login.assert_called_once()
+        self.assertEqual(mock_smtp_instance.send_message.call_count, 3)
+
+    def test_send_email_reconnects_when_unhealthy(self):
+        """Test that a session failing the NOOP health check is replaced."""
+        # Setup
+        mock_smtp_instance = fresh(_SMTP_SPEC)
+        mock_smtp_instance.noop.side_effect = smtplib.SMTPServerDisconnected()
+        self.mock_smtp.return_value = mock_smtp_instance
+
+        # Test
+        for _ in range(2):
+            self.client.send_email(**_EMAIL_KW)
+
+        # Assert
+        self.assertEqual(self.mock_smtp.call_count, 2)
+
+    def test_send_email_recycles_after_message_limit(self):
+        """Test that the session is recycled after max_messages_per_connection."""
+        # Setup
+        client = EmailClient(self.email, self.password, max_messages_per_connection=2)
+        mock_smtp_instance = fresh(_SMTP_SPEC)
+        mock_smtp_instance.noop.return_value = (250, b"OK")
+        self.mock_smtp.return_value = mock_smtp_instance
+
+        # Test
+        for _ in range(3):
+            client.send_email(**_EMAIL_KW)
+
+        # Assert
+        self.assertEqual(self.mock_smtp.call_count, 2)
+
+    def test_context_manager_closes_connection(self):
+        """Test that leaving the context manager quits the SMTP session."""
+        # Setup
+        mock_smtp_instance = fresh(_SMTP_SPEC)
+        self.mock_smtp.return_value = mock_smtp_instance
+
+        # Test
+        with EmailClient(self.email, self.password) as client:
+            client.send_email(**_EMAIL_KW)
+
+        # Assert
+        mock_smtp_instance.quit.assert_called_once()
+
+    def test_send_email_discards_connection_on_smtp_error(self):
+        """Test that a session that failed to send is not reused."""
+        # Setup
+        mock_smtp_instance = fresh(_SMTP_SPEC)
+        mock_smtp_instance.noop.return_value = (250, b"OK")
+        mock_smtp_instance.send_message.side_effect = [
+            smtplib.SMTPException("Test error"),
+            {},
+        ]
+        self.mock_smtp.return_value = mock_smtp_instance
+
+        # Test
+        self.assertFalse(self.client.send_email(**_EMAIL_KW))
+        self.assertTrue(self.client.send_email(**_EMAIL_KW))
+
+        # Assert
+        self.assertEqual(self.mock_smtp.call_count, 2)
+        mock_smtp_instance.close.assert_called_once()
+
+    def test_send_bulk(self):
+        """Test sending several emails over pooled sessions."""
+        # Setup
+        mock_smtp_instance = fresh(_SMTP_SPEC)
+        mock_smtp_instance.noop.return_value = (250, b"OK")
+        mock_smtp_instance.send_message.side_effect = [
+            {},
+            smtplib.SMTPRecipientsRefused({}),
+            {},
+        ]
+        self.mock_smtp.return_value = mock_smtp_instance
+        messages = [
+            (["first@example.com"], "Subject 1", "Body 1"),
+            (["second@example.com"], "Subject 2", "Body 2"),
+            (["third@example.com"], "Subject 3", "Body 3"),
+        ]
+
+        # Test
+        results = self.client.send_bulk(messages)
+
+        # Assert
+        self.assertEqual(results, [True, False, True])
+        sent = [c.args[0] for c in mock_smtp_instance.send_message.call_args_list]
+        self.assertEqual([m["To"] for m in sent], [m[0][0] for m in messages])
+        self.assertEqual([m["Subject"] for m in sent], [m[1] for m in messages])
+        self.assertEqual({m["From"] for m in sent}, {self.email})
+
+    def test_send_email_invalid_attachment(self):
+        """Test that an invalid attachment fails before any SMTP connection."""
+        self.mock_smtp.side_effect = AssertionError("SMTP must not be constructed")
+        with patch(
+            "builtins.open", side_effect=FileNotFoundError("nonexistent_file.txt")
+        ):
+            result = self.client.send_email(
+                **_EMAIL_KW,
+                attachments=["nonexistent_file.txt"],
+            )
         self.assertFalse(result)
+        self.mock_smtp.assert_not_called()
 
 
 if __name__ == "__main__":
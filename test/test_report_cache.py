@@ -0,0 +1,39 @@
+import os
+import tempfile
+import unittest
+from src.report_cache import ReportCache
+
+
+class TestReportCache(unittest.TestCase):
+    def setUp(self):
+        """Set up test cases."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache = ReportCache(os.path.join(self.tmpdir.name, "report_cache.sqlite"))
+        self.report = {"url": "a", "transactions": [{"ticker": "ABC"}]}
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.cache.close()
+        self.tmpdir.cleanup()
+
+    def test_put_and_get(self):
+        """Test that a report with validators is cached with its conditional headers."""
+        headers = {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+
+        self.assertTrue(self.cache.put("a", headers, self.report))
+
+        self.assertEqual(self.cache.get("a"), self.report)
+        self.assertEqual(
+            self.cache.conditional_headers("a"),
+            {
+                "If-None-Match": '"v1"',
+                "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+            },
+        )
+
+    def test_put_without_validators(self):
+        """Test that reports without ETag or Last-Modified are not cached."""
+        self.assertFalse(self.cache.put("a", {}, self.report))
+
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(self.cache.conditional_headers("a"), {})
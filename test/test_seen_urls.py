@@ -0,0 +1,39 @@
+import os
+import tempfile
+import unittest
+from src.seen_urls import SeenUrlStore
+
+
+class TestSeenUrlStore(unittest.TestCase):
+    def setUp(self):
+        """Set up test cases."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "seen_urls.sqlite")
+        self.store = SeenUrlStore(self.path)
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.store.close()
+        self.tmpdir.cleanup()
+
+    def test_filter_new_keeps_unseen_urls_in_order(self):
+        """Test that only URLs not recorded yet are returned."""
+        self.assertTrue(self.store.add(["b"]))
+
+        self.assertEqual(self.store.filter_new(["c", "b", "a"]), ["c", "a"])
+
+    def test_add_persists_between_stores(self):
+        """Test that recorded URLs survive reopening the database."""
+        self.store.add(["a", "a"], timestamp="2024-01-01T00:00:00")
+        self.store.close()
+
+        with SeenUrlStore(self.path) as store:
+            self.assertEqual(store.filter_new(["a", "b"]), ["b"])
+            self.store = store
+
+    def test_filter_new_returns_all_urls_on_error(self):
+        """Test that an unreadable store does not drop any URLs."""
+        self.store.close()
+
+        self.assertEqual(self.store.filter_new(["a"]), ["a"])
+        self.assertFalse(self.store.add(["a"]))
@@ -1,43 +1,119 @@
 import unittest
-from unittest.mock import patch, MagicMock
+import pytest
+from unittest.mock import (
+    patch,
+    MagicMock,
+    AsyncMock,
+    Mock,
+    create_autospec,
+    mock_open,
+    DEFAULT,
+)
+import asyncio
 import json
+import aiohttp
 import os
-from src.senate_scraper import SenateScraper
+from concurrent.futures.process import BrokenProcessPool
+import requests
+from src import senate_scraper
+from src.senate_scraper import (
+    BaseScraper,
+    EFDAccessDeniedError,
+    SenateHttpScraper,
+)
 from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.remote.webelement import WebElement
+from src.email_client import EmailClient
+from test._helpers import fresh, written
+
+# create_autospec walks EmailClient's signatures, so do it once; fresh() resets it
+_EMAIL_CLIENT_SPEC = create_autospec(EmailClient, instance=True, spec_set=True)
 
 
 class TestSenateScraper(unittest.TestCase):
-    def setUp(self):
-        """Set up test cases."""
-        self.patcher = patch("selenium.webdriver.Chrome")
-        self.mock_driver = self.patcher.start()
-        self.scraper = SenateScraper(headless=True)
+    @classmethod
+    def setUpClass(cls):
+        """Make every sleep return at once."""
+        cls.sleep_patcher = patch("time.sleep", lambda *args, **kwargs: None)
+        cls.sleep_patcher.start()
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up after tests."""
-        self.patcher.stop()
+        cls.sleep_patcher.stop()
+
+    @pytest.fixture(autouse=True)
+    def _use_scraper(self, scraper, chrome_driver_cls):
+        """Take the shared scraper and patched Chrome class from conftest."""
+        self.scraper = scraper
+        self.mock_driver = chrome_driver_cls
 
     def test_init(self):
         """Test SenateScraper initialization."""
         self.assertIsNotNone(self.scraper.driver)
         self.assertIsNone(self.scraper.email_client)
 
-    @patch("selenium.webdriver.support.wait.WebDriverWait")
-    @patch("selenium.webdriver.support.expected_conditions.element_to_be_clickable")
-    @patch("time.sleep")
-    def test_accept_agreement_success(self, mock_sleep, mock_ec, mock_wait):
-        """Test successful agreement acceptance."""
-        # Create mock checkbox
-        mock_checkbox = MagicMock()
-        mock_checkbox.is_selected.return_value = False
+    @patch.dict(os.environ, {"WEBDRIVER_URL": "http://127.0.0.1:9515"})
+    @patch("selenium.webdriver.Remote")
+    def test_setup_driver_remote(self, mock_remote):
+        """Test attaching to a running WebDriver service when WEBDRIVER_URL is set."""
+        self.mock_driver.reset_mock()
+
+        driver = self.scraper._setup_driver(headless=True)
+
+        self.assertIs(driver, mock_remote.return_value)
+        self.assertEqual(
+            mock_remote.call_args.kwargs["command_executor"], "http://127.0.0.1:9515"
+        )
+        self.mock_driver.assert_not_called()
 
-        # Setup the condition to return our mock checkbox
-        mock_ec.return_value = lambda driver: mock_checkbox
+    @patch.dict(os.environ, {"CHROME_OPTIONS": "--disable-gpu --window-size=800,600"})
+    def test_setup_driver_options(self):
+        """Test Chrome options merge CHROME_OPTIONS with the defaults."""
+        self.scraper._setup_driver(headless=True)
+        options = self.mock_driver.call_args.kwargs["options"]
 
-        # Setup WebDriverWait
-        mock_wait_instance = MagicMock()
-        mock_wait.return_value = mock_wait_instance
-        mock_wait_instance.until.side_effect = lambda condition: condition(None)
+        self.assertEqual(options.arguments.count("--disable-gpu"), 1)
+        self.assertIn("--window-size=800,600", options.arguments)
+        self.assertIn("--blink-settings=imagesEnabled=false", options.arguments)
+        self.assertIn("--headless", options.arguments)
+        self.assertEqual(options.page_load_strategy, "eager")
+        self.assertFalse(
+            any(arg.startswith("--user-data-dir") for arg in options.arguments)
+        )
+        self.assertEqual(
+            options.experimental_options["prefs"][
+                "profile.managed_default_content_settings.images"
+            ],
+            2,
+        )
+
+    @patch.dict(os.environ, {"CHROME_OPTIONS": ""})
+    def test_setup_driver_profile_dir(self):
+        """Test that a persistent profile and disk cache are configured."""
+        self.scraper._setup_driver(headless=True, profile_dir="/tmp/profile")
+        options = self.mock_driver.call_args.kwargs["options"]
+
+        self.assertIn("--user-data-dir=/tmp/profile", options.arguments)
+        self.assertIn("--disk-cache-size=104857600", options.arguments)
+
+    @patch.dict(os.environ, {"CHROME_OPTIONS": "--user-data-dir=/tmp/env-profile"})
+    def test_setup_driver_profile_dir_from_env(self):
+        """Test that CHROME_OPTIONS keeps precedence over the profile directory."""
+        self.scraper._setup_driver(headless=True, profile_dir="/tmp/profile")
+        options = self.mock_driver.call_args.kwargs["options"]
+
+        self.assertNotIn("--user-data-dir=/tmp/profile", options.arguments)
+        self.assertIn("--user-data-dir=/tmp/env-profile", options.arguments)
+
+    def test_accept_agreement_success(self):
+        """Test successful agreement acceptance."""
+        # The real waits and conditions succeed on the first poll against the mock driver
+        mock_checkbox = Mock(spec=WebElement)
+        mock_checkbox.is_displayed.return_value = True
+        mock_checkbox.is_enabled.return_value = True
+        mock_checkbox.is_selected.return_value = False
+        self.scraper.driver.find_element.return_value = mock_checkbox
 
         # Test
         result = self.scraper.accept_agreement()
@@ -45,7 +121,7 @@ class TestSenateScraper(unittest.TestCase):
         # Assertions
         self.assertTrue(result)
         mock_checkbox.click.assert_called_once()
-        mock_sleep.assert_called_once_with(3)
+        self.scraper.driver.find_element.assert_called_with("id", "reportTypes")
 
     @patch("selenium.webdriver.support.ui.WebDriverWait")
     def test_accept_agreement_timeout(self, mock_wait):
@@ -59,17 +135,15 @@ class TestSenateScraper(unittest.TestCase):
         # Assert
         self.assertFalse(result)
 
-    def test_navigate_to_search_success(self):
-        """Test successful navigation to search page."""
-        result = self.scraper.navigate_to_search()
-        self.assertTrue(result)
-        self.scraper.driver.get.assert_called_once()
+    def test_navigate_to_search(self):
+        """Test navigation to the search page succeeding and failing."""
+        for side_effect, expected in [(None, True), (Exception("Test error"), False)]:
+            with self.subTest(side_effect=side_effect):
+                self.scraper.driver.get.reset_mock()
+                self.scraper.driver.get.side_effect = side_effect
 
-    def test_navigate_to_search_failure(self):
-        """Test failed navigation to search page."""
-        self.scraper.driver.get.side_effect = Exception("Test error")
-        result = self.scraper.navigate_to_search()
-        self.assertFalse(result)
+                self.assertIs(self.scraper.navigate_to_search(), expected)
+                self.scraper.driver.get.assert_called_once_with(senate_scraper.BASE_URL)
 
     def test_save_reports_to_json(self):
         """Test saving reports to JSON file."""
@@ -77,44 +151,65 @@ class TestSenateScraper(unittest.TestCase):
         test_reports = [{"test": "data"}]
         filename = "test_reports.json"
 
-        try:
-            # Test
+        # Test
+        with patch("src.senate_scraper.open", mock_open(), create=True) as mocked_open:
             result = self.scraper.save_reports_to_json(test_reports, filename)
 
-            # Assert
-            self.assertIsNotNone(result)
-            self.assertTrue(os.path.exists(filename))
-
-            # Verify content
-            with open(filename, "r", encoding="utf-8") as f:
-                saved_data = json.load(f)
-            self.assertEqual(saved_data, test_reports)
-
-        finally:
-            # Cleanup
-            if os.path.exists(filename):
-                os.remove(filename)
-
-    def test_check_empty_results_true(self):
-        """Test empty results check when results are empty."""
-        mock_element = MagicMock()
-        self.scraper.driver.find_elements.return_value = [mock_element]
-        result = self.scraper.check_empty_results()
-        self.assertTrue(result)
+        # Assert
+        self.assertEqual(result, filename)
+        mocked_open.assert_called_once_with(filename, "wb")
+        self.assertEqual(json.loads(written(mocked_open)), test_reports)
 
-    def test_check_empty_results_false(self):
-        """Test empty results check when results exist."""
-        self.scraper.driver.find_elements.return_value = []
-        result = self.scraper.check_empty_results()
-        self.assertFalse(result)
+    def test_save_reports_to_json_pretty(self):
+        """Test saving reports to an indented JSON file."""
+        test_reports = [{"test": "données"}]
+
+        with patch("src.senate_scraper.open", mock_open(), create=True) as mocked_open:
+            self.scraper.save_reports_to_json(test_reports, "x.json", pretty=True)
+
+        content = written(mocked_open).decode("utf-8")
+        self.assertIn('\n  {\n    "test": "données"', content)
+        self.assertEqual(json.loads(content), test_reports)
+
+    def test_save_reports_to_json_columnar(self):
+        """Test saving transactions as one list per field."""
+        transactions = [
+            {field: f"{field}-{i}" for field in senate_scraper.TRANSACTION_FIELDS}
+            for i in range(2)
+        ]
+        test_reports = [{"url": "a", "transactions": transactions}]
+
+        with patch("src.senate_scraper.open", mock_open(), create=True) as mocked_open:
+            self.scraper.save_reports_to_json(test_reports, "x.json", columnar=True)
+
+        saved = json.loads(written(mocked_open))
+        self.assertEqual(saved[0]["url"], "a")
+        self.assertEqual(saved[0]["transactions"]["ticker"], ["ticker-0", "ticker-1"])
+        self.assertEqual(test_reports[0]["transactions"], transactions)
 
-    @patch("src.senate_scraper.EmailClient")
-    def test_send_notification(self, mock_email_client):
+    def test_check_empty_results(self):
+        """Test the empty results check with and without the empty-results marker."""
+        for elements, expected in [([Mock(spec=WebElement)], True), ([], False)]:
+            with self.subTest(elements=elements):
+                self.scraper.driver.find_elements.return_value = elements
+                self.assertIs(self.scraper.check_empty_results(), expected)
+
+    def test_cleanup_is_idempotent(self):
+        """Test that calling cleanup twice quits the driver only once."""
+        driver = self.scraper.driver
+
+        self.scraper.cleanup()
+        self.scraper.cleanup()
+
+        driver.quit.assert_called_once()
+        self.assertIsNone(self.scraper.driver)
+
+    def test_send_notification(self):
         """Test sending notification."""
         # Setup
         test_subject = "Test Subject"
         test_body = "Test Body"
-        mock_email_client_instance = MagicMock()
+        mock_email_client_instance = fresh(_EMAIL_CLIENT_SPEC)
         self.scraper.email_client = mock_email_client_instance
 
         # Test
@@ -126,13 +221,11 @@ class TestSenateScraper(unittest.TestCase):
     def test_extract_report_urls(self):
         """Test extracting report URLs."""
         # Setup
-        mock_tbody = MagicMock()
-        mock_link1 = MagicMock()
-        mock_link1.get_attribute.return_value = "http://test1.com"
-        mock_link2 = MagicMock()
-        mock_link2.get_attribute.return_value = "http://test2.com"
-        mock_tbody.find_elements.return_value = [mock_link1, mock_link2]
-        self.scraper.driver.find_element.return_value = mock_tbody
+        self.scraper.driver.execute_script.return_value = [
+            "http://test1.com",
+            None,
+            "http://test2.com",
+        ]
 
         # Test
         urls = self.scraper.extract_report_urls()
@@ -141,7 +234,573 @@ class TestSenateScraper(unittest.TestCase):
         self.assertEqual(len(urls), 2)
         self.assertEqual(urls[0], "http://test1.com")
         self.assertEqual(urls[1], "http://test2.com")
+        self.scraper.driver.execute_script.assert_called_once()
+        self.scraper.driver.find_element.assert_not_called()
+
+    def test_fetch_report_index_json(self):
+        """Test reading report URLs from the search endpoint in the browser."""
+        self.scraper.driver.execute_async_script.return_value = {
+            "data": [["A", "B", "Senator", '<a href="/search/view/ptr/1/">PTR</a>']]
+        }
+
+        urls = self.scraper.fetch_report_index_json("01/02/2024")
+
+        self.assertEqual(urls, ["https://efdsearch.senate.gov/search/view/ptr/1/"])
+        _, form, url = self.scraper.driver.execute_async_script.call_args.args
+        self.assertEqual(url, senate_scraper.REPORT_DATA_URL)
+        self.assertEqual(form["submitted_start_date"], "01/02/2024 00:00:00")
+
+    def test_find_report_urls_falls_back_to_search_form(self):
+        """Test searching with the form when the endpoint request fails."""
+        self.scraper.driver.execute_async_script.return_value = {"error": "HTTP 403"}
+        with (
+            patch.object(self.scraper, "accept_agreement", return_value=True),
+            patch.object(
+                self.scraper, "fill_search_form", return_value=True
+            ) as mock_fill,
+            patch.object(self.scraper, "extract_report_urls", return_value=["a"]),
+        ):
+            self.assertEqual(self.scraper.find_report_urls(), ["a"])
+
+        mock_fill.assert_called_once()
+
+    def test_extract_report_urls_error(self):
+        """Test extracting report URLs when the script fails."""
+        self.scraper.driver.execute_script.side_effect = Exception("Test error")
+        self.assertEqual(self.scraper.extract_report_urls(), [])
+
+    @patch.multiple("aiohttp", TCPConnector=DEFAULT, ClientSession=DEFAULT)
+    def test_fetch_reports(self, TCPConnector, ClientSession):
+        """Test fetching report pages concurrently with browser cookies."""
+        # Setup
+        self.scraper.driver.get_cookies.return_value = [
+            {"name": "csrftoken", "value": "abc"}
+        ]
+        ok_response = MagicMock(status=200)
+        ok_response.read = AsyncMock(return_value=b"<html>report</html>")
+        failed_response = MagicMock(status=404)
+        failed_response.raise_for_status.side_effect = aiohttp.ClientResponseError(
+            MagicMock(), (), status=404
+        )
+        mock_session = MagicMock()
+        mock_session.get.return_value.__aenter__.side_effect = [
+            ok_response,
+            failed_response,
+        ]
+        ClientSession.return_value.__aenter__.return_value = mock_session
+
+        # Test
+        pages = asyncio.run(
+            self.scraper.fetch_reports(["http://test1.com", "http://test2.com"])
+        )
+
+        # Assert
+        self.assertEqual(pages, [b"<html>report</html>", None])
+        self.assertEqual(
+            ClientSession.call_args.kwargs["cookies"], {"csrftoken": "abc"}
+        )
+        TCPConnector.assert_called_once_with(limit=10)
+        timeout = ClientSession.call_args.kwargs["timeout"]
+        self.assertIsNone(timeout.total)
+        self.assertEqual(timeout.sock_read, senate_scraper.TIMEOUT)
+
+    @patch("asyncio.sleep", new_callable=AsyncMock)
+    def test_fetch_report_retries(self, mock_sleep):
+        """Test that transient HTTP errors and connection failures are retried."""
+        # Setup
+        unavailable = MagicMock(status=503)
+        ok_response = MagicMock(status=200)
+        ok_response.read = AsyncMock(return_value=b"<html>report</html>")
+        mock_session = MagicMock()
+        mock_session.get.return_value.__aenter__.side_effect = [
+            unavailable,
+            aiohttp.ClientConnectionError("reset"),
+            ok_response,
+        ]
+
+        # Test
+        page = asyncio.run(self.scraper._fetch_report(mock_session, "http://test1.com"))
+
+        # Assert
+        self.assertEqual(page[2], b"<html>report</html>")
+        unavailable.raise_for_status.assert_not_called()
+        self.assertEqual(mock_sleep.await_count, 2)
+
+    def test_process_single_report(self):
+        """Test extracting transactions from the report table in one script call."""
+        cells = [str(value) for value in range(1, 10)]
+        self.scraper.driver.execute_script.return_value = [cells, ["short"]]
+
+        report = self.scraper.process_single_report("http://test.com")
+
+        self.assertEqual(report["url"], "http://test.com")
+        self.assertEqual(len(report["transactions"]), 1)
+        self.assertEqual(report["transactions"][0]["number"], "1")
+        self.assertEqual(report["transactions"][0]["comment"], "9")
+        self.scraper.driver.get.assert_called_once_with("http://test.com")
+        self.scraper.driver.execute_script.assert_called_once()
+
+    def test_process_single_report_from_page_source(self):
+        """Test extracting transactions from the page HTML without injecting scripts."""
+        self.scraper.parse_page_source = True
+        self.scraper.driver.page_source = (
+            '<table class="table"><tr><th>#</th></tr>'
+            "<tr>" + "".join(f"<td> {i} </td>" for i in range(1, 10)) + "</tr></table>"
+        )
+
+        report = self.scraper.process_single_report("http://test.com")
+
+        self.assertEqual(report["transactions"][0]["number"], "1")
+        self.assertEqual(report["transactions"][0]["comment"], "9")
+        self.scraper.driver.execute_script.assert_not_called()
+
+    def test_process_single_report_logs_summary(self):
+        """Test that transactions are summarized at INFO and listed at DEBUG."""
+        cells = [str(value) for value in range(1, 10)]
+        self.scraper.driver.execute_script.return_value = [cells, cells]
+
+        with self.assertLogs("src.senate_scraper", level="INFO") as logs:
+            self.scraper.process_single_report("http://test.com")
+
+        self.assertIn("Extracted 2 transactions from http://test.com", logs.output[-1])
+        self.assertFalse(any("Extracted transaction:" in line for line in logs.output))
+
+    def test_process_all_reports_single_worker(self):
+        """Test that one worker processes reports in this browser."""
+        self.scraper.report_workers = 1
+        with patch.object(
+            self.scraper, "process_single_report", side_effect=[{"url": "a"}, None]
+        ) as mock_process:
+            reports = self.scraper.process_all_reports(["a", "b"])
+
+        self.assertEqual(reports, [{"url": "a"}])
+        self.assertEqual(mock_process.call_count, 2)
+        timestamps = {call.args[1] for call in mock_process.call_args_list}
+        self.assertEqual(len(timestamps), 1)
+
+    @patch("concurrent.futures.ProcessPoolExecutor")
+    def test_process_all_reports_parallel(self, mock_executor_cls):
+        """Test that reports are spread over a pool of worker processes."""
+        mock_executor = mock_executor_cls.return_value.__enter__.return_value
+        mock_executor.map.return_value = iter([{"url": "a"}, None, {"url": "c"}])
+
+        reports = self.scraper.process_all_reports(["a", "b", "c"])
+
+        self.assertEqual(reports, [{"url": "a"}, {"url": "c"}])
+        kwargs = mock_executor_cls.call_args.kwargs
+        self.assertEqual(kwargs["max_workers"], 3)
+        self.assertIs(kwargs["initializer"], senate_scraper._init_report_worker)
+        func, urls, timestamps = mock_executor.map.call_args.args
+        self.assertIs(func, senate_scraper._process_report_in_worker)
+        self.assertEqual(urls, ["a", "b", "c"])
+        self.assertIsInstance(next(timestamps), str)
+
+    def test_process_all_reports_writes_ndjson(self):
+        """Test that each report is appended to the NDJSON file as it completes."""
+        self.scraper.report_workers = 1
+        with (
+            patch("src.senate_scraper.open", mock_open(), create=True) as mocked_open,
+            patch.object(
+                self.scraper,
+                "process_single_report",
+                side_effect=[{"url": "a"}, None, {"url": "c"}],
+            ),
+        ):
+            self.scraper.process_all_reports(["a", "b", "c"], "x.ndjson")
+
+        mocked_open.assert_called_once_with("x.ndjson", "a+b")
+        lines = written(mocked_open).splitlines()
+        self.assertEqual(
+            [json.loads(line) for line in lines], [{"url": "a"}, {"url": "c"}]
+        )
+
+    def test_process_all_reports_skips_reports_already_in_ndjson(self):
+        """Test that rerunning the same day does not append a report twice."""
+        self.scraper.report_workers = 1
+        # An earlier run wrote "a" and crashed halfway through writing "b"
+        with (
+            patch(
+                "src.senate_scraper.open",
+                mock_open(read_data=b'{"url":"a"}\n{"url":'),
+                create=True,
+            ) as mocked_open,
+            patch.object(
+                self.scraper,
+                "process_single_report",
+                side_effect=[{"url": "a"}, {"url": "b"}],
+            ),
+        ):
+            reports = self.scraper.process_all_reports(["a", "b"], "x.ndjson")
+
+        self.assertEqual(len(reports), 2)
+        self.assertEqual(written(mocked_open), b'\n{"url":"b"}\n')
+
+    @patch("concurrent.futures.ProcessPoolExecutor")
+    def test_process_all_reports_broken_pool_resumes(self, mock_executor_cls):
+        """Test that only reports not finished by the pool are processed again."""
+        mock_executor = mock_executor_cls.return_value.__enter__.return_value
+
+        def results():
+            yield {"url": "a"}
+            raise BrokenProcessPool("Test error")
+
+        mock_executor.map.return_value = results()
+
+        with patch.object(
+            self.scraper, "process_single_report", return_value={"url": "b"}
+        ) as mock_process:
+            reports = self.scraper.process_all_reports(["a", "b"])
+
+        self.assertEqual(reports, [{"url": "a"}, {"url": "b"}])
+        self.assertEqual(mock_process.call_args.args[0], "b")
+
+    @patch("concurrent.futures.ProcessPoolExecutor")
+    def test_process_all_reports_broken_pool(self, mock_executor_cls):
+        """Test falling back to sequential processing when the pool breaks."""
+        mock_executor = mock_executor_cls.return_value.__enter__.return_value
+        mock_executor.map.side_effect = BrokenProcessPool("Test error")
+
+        with patch.object(
+            self.scraper, "process_single_report", return_value={"url": "x"}
+        ):
+            reports = self.scraper.process_all_reports(["a", "b"])
+
+        self.assertEqual(len(reports), 2)
+
+    @patch("multiprocessing.util.Finalize")
+    @patch("src.senate_scraper.time.sleep")
+    @patch("src.senate_scraper.SenateScraper")
+    def test_init_report_worker(self, mock_scraper_cls, mock_sleep, mock_finalize):
+        """Test that each worker staggers its start and seeds its own session."""
+        started = MagicMock(value=2)
+
+        senate_scraper._init_report_worker(started, "/tmp/profile", True)
+
+        self.assertEqual(started.value, 3)
+        mock_sleep.assert_called_once_with(2 * senate_scraper.WORKER_STAGGER_SECONDS)
+        mock_scraper_cls.assert_called_once_with(
+            headless=True,
+            report_workers=1,
+            profile_dir="/tmp/profile-worker-2",
+            parse_page_source=True,
+        )
+        worker = mock_scraper_cls.return_value
+        worker.navigate_to_search.assert_called_once()
+        worker.accept_agreement.assert_called_once()
+        mock_finalize.assert_called_once_with(None, worker.cleanup, exitpriority=10)
+        self.assertIs(senate_scraper._worker_scraper, worker)
+        senate_scraper._worker_scraper = None
+
+    @patch.dict(
+        os.environ,
+        {"CHROME_OPTIONS": "--no-sandbox --user-data-dir=/tmp/chrome-data"},
+    )
+    @patch("multiprocessing.util.Finalize")
+    @patch("src.senate_scraper.time.sleep")
+    @patch("src.senate_scraper.SenateScraper")
+    def test_init_report_worker_profile_dir_from_env(
+        self, mock_scraper_cls, mock_sleep, mock_finalize
+    ):
+        """Test that a profile set in CHROME_OPTIONS is still numbered per worker."""
+        started = MagicMock(value=1)
+
+        senate_scraper._init_report_worker(started, "/tmp/profile")
+
+        self.assertEqual(
+            mock_scraper_cls.call_args.kwargs["profile_dir"],
+            "/tmp/chrome-data-worker-1",
+        )
+        self.assertEqual(os.environ["CHROME_OPTIONS"], "--no-sandbox")
+        senate_scraper._worker_scraper = None
+
+
+class TestSenateHttpScraper(unittest.TestCase):
+    def setUp(self):
+        """Set up test cases."""
+        self.patcher = patch("requests.Session")
+        self.mock_session_cls = self.patcher.start()
+        self.scraper = SenateHttpScraper()
+        self.session = self.scraper.session
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.patcher.stop()
+
+    @staticmethod
+    def _response(status_code=200, content=b"", json_data=None):
+        """Create a mock HTTP response."""
+        response = MagicMock(status_code=status_code, content=content)
+        response.json.return_value = json_data
+        if status_code >= 400:
+            response.raise_for_status.side_effect = requests.HTTPError(str(status_code))
+        return response
+
+    @patch("requests.adapters.HTTPAdapter")
+    def test_setup_session(self, mock_adapter_cls):
+        """Test that the session reuses pooled connections and retries transient errors."""
+        session = SenateHttpScraper._setup_session()
+
+        session.mount.assert_called_with("https://", mock_adapter_cls.return_value)
+        retry = mock_adapter_cls.call_args.kwargs["max_retries"]
+        self.assertEqual(retry.total, senate_scraper.HTTP_RETRIES)
+        self.assertNotIn(403, retry.status_forcelist)
+        self.assertEqual(
+            session.headers.update.call_args.args[0]["User-Agent"],
+            senate_scraper.USER_AGENT,
+        )
+
+    def test_accept_agreement_success(self):
+        """Test accepting the agreement with the page's CSRF token."""
+        self.session.get.return_value = self._response(
+            content=b"<form><input name='csrfmiddlewaretoken' value='form-token'></form>"
+        )
+        self.session.post.return_value = self._response()
+        self.session.cookies.get.return_value = "cookie-token"
+
+        self.assertTrue(self.scraper.accept_agreement())
+
+        data = self.session.post.call_args.kwargs["data"]
+        self.assertEqual(data["csrfmiddlewaretoken"], "form-token")
+        self.assertEqual(data["prohibition_agreement"], "1")
+        self.assertEqual(self.scraper.csrf_token, "cookie-token")
+
+    def test_accept_agreement_missing_token(self):
+        """Test accepting the agreement when the page has no CSRF token."""
+        self.session.get.return_value = self._response(content=b"<html></html>")
+
+        self.assertFalse(self.scraper.accept_agreement())
+        self.session.post.assert_not_called()
+
+    def test_accept_agreement_access_denied(self):
+        """Test that HTTP 403 raises so callers can fall back to Selenium."""
+        self.session.get.return_value = self._response(status_code=403)
+
+        with self.assertRaises(EFDAccessDeniedError):
+            self.scraper.accept_agreement()
+
+    @patch("src.senate_scraper.REPORT_PAGE_SIZE", 2)
+    def test_search_report_urls_paginates(self):
+        """Test collecting report URLs across result pages."""
+        link = '<a href="/search/view/ptr/{}/" target="_blank">Report</a>'
+        self.session.post.side_effect = [
+            self._response(
+                json_data={
+                    "data": [
+                        ["A", "B", "C", link.format("one"), "01/01/2024"],
+                        ["D", "E", "F", link.format("two"), "01/01/2024"],
+                    ]
+                }
+            ),
+            self._response(json_data={"data": []}),
+        ]
+
+        urls = self.scraper.search_report_urls("01/01/2024")
+
+        self.assertEqual(
+            urls,
+            [
+                "https://efdsearch.senate.gov/search/view/ptr/one/",
+                "https://efdsearch.senate.gov/search/view/ptr/two/",
+            ],
+        )
+        starts = [c.kwargs["data"]["start"] for c in self.session.post.call_args_list]
+        self.assertEqual(starts, ["0", "2"])
+
+    def test_search_report_urls_access_denied(self):
+        """Test that a 403 from the search endpoint raises."""
+        self.session.post.return_value = self._response(status_code=403)
+
+        with self.assertRaises(EFDAccessDeniedError):
+            self.scraper.search_report_urls()
+
+    def test_search_report_urls_error(self):
+        """Test searching for reports with an unexpected response."""
+        self.session.post.return_value = self._response(json_data={})
+
+        self.assertIsNone(self.scraper.search_report_urls())
+
+    def test_process_single_report(self):
+        """Test extracting transactions from a report page."""
+        cells = "".join(f"<td> {value} </td>" for value in range(1, 10))
+        self.session.get.return_value = self._response(
+            content=(
+                "<table class='table table-striped'>"
+                "<thead><tr><th>#</th></tr></thead>"
+                f"<tbody><tr>{cells}</tr><tr><td>short</td></tr></tbody>"
+                "</table>"
+            ).encode()
+        )
+
+        report = self.scraper.process_single_report("http://test.com")
+
+        self.assertEqual(report["url"], "http://test.com")
+        self.assertEqual(len(report["transactions"]), 1)
+        self.assertEqual(report["transactions"][0]["number"], "1")
+        self.assertEqual(report["transactions"][0]["comment"], "9")
+
+    def test_process_all_reports_fetches_concurrently(self):
+        """Test that reports are extracted as their pages arrive and returned in order."""
+        page = (
+            '<table class="table"><tr><th>#</th></tr>'
+            "<tr>" + "".join(f"<td>{i}</td>" for i in range(1, 10)) + "</tr></table>"
+        )
+        pages = {
+            "a": (200, {}, page),
+            "b": None,
+            "c": (200, {}, "<p/>"),
+            "d": (200, {}, page),
+        }
+        self.session.cookies = [MagicMock(value="abc")]
+        self.session.cookies[0].name = "csrftoken"
+
+        async def fetch(session, url, headers=None):
+            # Finish "d" first so completion order differs from input order
+            await asyncio.sleep(0 if url == "d" else 0.01)
+            return pages[url]
+
+        with (
+            patch.object(self.scraper, "_client_session") as mock_client_session,
+            patch.object(self.scraper, "_fetch_report", side_effect=fetch),
+            patch("src.senate_scraper.open", mock_open(), create=True) as mocked_open,
+        ):
+            reports = self.scraper.process_all_reports(["a", "b", "c", "d"], "x.ndjson")
+
+        self.assertEqual([report["url"] for report in reports], ["a", "d"])
+        self.assertEqual(reports[0]["transactions"][0]["comment"], "9")
+        lines = written(mocked_open).splitlines()
+        self.assertEqual([json.loads(line)["url"] for line in lines], ["d", "a"])
+        self.assertEqual(mock_client_session.call_args.args[0], {"csrftoken": "abc"})
+        self.session.get.assert_not_called()
+
+    def test_process_all_reports_survives_bad_pages(self):
+        """Test that an undecodable or unparsable page only loses its own report."""
+        row = "<tr>" + "".join(f"<td>{i}</td>" for i in range(1, 10)) + "</tr>"
+        page = f'<table class="table"><tr><th>#</th></tr>{row}</table>'
+        pages = {
+            "a": (200, {}, page.encode()),
+            # Declared UTF-8 but not valid UTF-8
+            "b": (200, {}, b'<meta charset="utf-8">' + page.encode() + b"\xff\xfe"),
+            # lxml refuses str input carrying an encoding declaration
+            "c": (200, {}, '<?xml version="1.0" encoding="utf-8"?>' + page),
+            "d": (200, {}, page.encode()),
+        }
+        self.session.cookies = []
+
+        async def fetch(session, url, headers=None):
+            return pages[url]
+
+        original = self.scraper._report_from_response
+
+        def report_from_response(url, *args):
+            if url == "d":
+                raise RuntimeError("Test error")
+            return original(url, *args)
+
+        with (
+            patch.object(self.scraper, "_client_session"),
+            patch.object(self.scraper, "_fetch_report", side_effect=fetch),
+            patch.object(
+                self.scraper,
+                "_report_from_response",
+                side_effect=report_from_response,
+            ),
+        ):
+            reports = self.scraper.process_all_reports(["a", "b", "c", "d"])
+
+        self.assertEqual([report["url"] for report in reports], ["a", "b"])
+        self.assertEqual(reports[1]["transactions"][0]["number"], "1")
+
+    def test_process_single_report_not_modified(self):
+        """Test reusing the cached report when the page has not changed."""
+        cache = MagicMock()
+        cache.conditional_headers.return_value = {"If-None-Match": '"v1"'}
+        cache.get.return_value = {"url": "http://test.com", "transactions": [{}]}
+        self.scraper.report_cache = cache
+        self.session.get.return_value = self._response(status_code=304)
+
+        report = self.scraper.process_single_report("http://test.com", "now")
+
+        self.assertEqual(report["transactions"], [{}])
+        self.assertEqual(report["timestamp"], "now")
+        self.assertEqual(
+            self.session.get.call_args.kwargs["headers"], {"If-None-Match": '"v1"'}
+        )
+        cache.put.assert_not_called()
+
+    def test_process_single_report_error(self):
+        """Test processing a report that fails to load."""
+        self.session.get.return_value = self._response(status_code=500)
+
+        self.assertIsNone(self.scraper.process_single_report("http://test.com"))
+
+
+class TestBaseScraper(unittest.TestCase):
+    def test_incomplete_subclass_cannot_be_created(self):
+        """Test that a subclass missing a search or report method fails on creation."""
+
+        class SearchOnlyScraper(BaseScraper):
+            def find_report_urls(self):
+                return []
+
+        with self.assertRaises(TypeError):
+            SearchOnlyScraper()
+
+
+class TestRunScraper(unittest.TestCase):
+    def setUp(self):
+        """Set up test cases."""
+        self.scraper = MagicMock()
+        self.scraper.find_report_urls.return_value = ["a", "b"]
+        self.scraper.process_all_reports.side_effect = lambda urls, ndjson_file: [
+            {"url": url} for url in urls
+        ]
+        self.scraper.save_reports_to_json.return_value = "reports.json"
+        self.seen_urls = MagicMock()
+        self.seen_urls.filter_new.return_value = ["b"]
+
+    def test_run_scraper_skips_seen_urls(self):
+        """Test that already processed reports are skipped and new ones recorded."""
+        senate_scraper.run_scraper(self.scraper, self.seen_urls)
+
+        self.assertEqual(self.scraper.process_all_reports.call_args.args[0], ["b"])
+        self.assertRegex(
+            self.scraper.process_all_reports.call_args.kwargs["ndjson_file"],
+            r"^senate_reports_\d{4}-\d{2}-\d{2}\.ndjson$",
+        )
+        self.assertEqual(list(self.seen_urls.add.call_args.args[0]), ["b"])
+
+    def test_run_scraper_all_seen(self):
+        """Test that a run finding only processed reports sends no notification."""
+        self.seen_urls.filter_new.return_value = []
+
+        senate_scraper.run_scraper(self.scraper, self.seen_urls)
+
+        self.scraper.process_all_reports.assert_not_called()
+        self.scraper.save_reports_to_json.assert_not_called()
+        self.scraper.send_notification.assert_not_called()
+
+    def test_run_scraper_force(self):
+        """Test that forcing processes every report again."""
+        senate_scraper.run_scraper(self.scraper, self.seen_urls, force=True)
+
+        self.seen_urls.filter_new.assert_not_called()
+        self.assertEqual(self.scraper.process_all_reports.call_args.args[0], ["a", "b"])
+        self.assertEqual(list(self.seen_urls.add.call_args.args[0]), ["a", "b"])
+
+    def test_run_scraper_does_not_record_unsaved_reports(self):
+        """Test that reports are not marked as seen when saving fails."""
+        self.scraper.save_reports_to_json.return_value = None
+
+        senate_scraper.run_scraper(self.scraper, self.seen_urls)
+
+        self.seen_urls.add.assert_not_called()
+
+    def test_run_scraper_columnar(self):
+        """Test that the columnar output format is passed on to the JSON file."""
+        senate_scraper.run_scraper(self.scraper, self.seen_urls, columnar=True)
+
+        self.assertTrue(self.scraper.save_reports_to_json.call_args.kwargs["columnar"])
 
 
 if __name__ == "__main__":
-    unittest.main()
+    pytest.main([__file__])
@@ -0,0 +1,100 @@
+import unittest
+from unittest.mock import MagicMock
+import smtplib
+import threading
+from src.smtp_pool import SMTPConnectionPool
+
+
+class TestSMTPConnectionPool(unittest.TestCase):
+    def setUp(self):
+        """Set up test cases."""
+        self.connect = MagicMock(side_effect=self._new_connection)
+        self.pool = SMTPConnectionPool(
+            self.connect, max_connections=2, max_messages_per_connection=3
+        )
+
+    @staticmethod
+    def _new_connection():
+        """Create a mock SMTP session that passes the health check."""
+        conn = MagicMock()
+        conn.noop.return_value = (250, b"OK")
+        return conn
+
+    def test_reuses_idle_connection(self):
+        """Test that a released session is handed out again."""
+        conn = self.pool.acquire()
+        self.pool.release(conn)
+
+        self.assertIs(self.pool.acquire(), conn)
+        self.connect.assert_called_once()
+
+    def test_recycles_after_message_limit(self):
+        """Test that a session is closed once it reaches the message limit."""
+        conn = self.pool.acquire()
+        for _ in range(2):
+            self.pool.release(conn)
+            self.assertIs(self.pool.acquire(), conn)
+        self.pool.release(conn)
+
+        conn.quit.assert_called_once()
+        self.assertIsNot(self.pool.acquire(), conn)
+
+    def test_discards_broken_connection(self):
+        """Test that a session released as broken is closed without QUIT."""
+        conn = self.pool.acquire()
+        self.pool.release(conn, broken=True)
+
+        conn.close.assert_called_once()
+        conn.quit.assert_not_called()
+        self.assertIsNot(self.pool.acquire(), conn)
+
+    def test_discards_unhealthy_idle_connection(self):
+        """Test that an idle session failing NOOP is closed without QUIT and replaced."""
+        conn = self.pool.acquire()
+        self.pool.release(conn)
+        conn.noop.side_effect = smtplib.SMTPServerDisconnected()
+
+        self.assertIsNot(self.pool.acquire(), conn)
+        conn.close.assert_called_once()
+        conn.quit.assert_not_called()
+
+    def test_blocks_at_max_connections(self):
+        """Test that acquire blocks until a session is released."""
+        first = self.pool.acquire()
+        self.pool.acquire()
+        acquired = threading.Event()
+
+        def worker():
+            self.pool.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        self.assertFalse(acquired.wait(0.1))
+
+        self.pool.release(first)
+        thread.join(timeout=1)
+        self.assertTrue(acquired.is_set())
+        self.assertEqual(self.connect.call_count, 2)
+
+    def test_failed_connect_frees_slot(self):
+        """Test that a connection error does not leak a pool slot."""
+        self.connect.side_effect = smtplib.SMTPAuthenticationError(535, b"Bad")
+        for _ in range(3):
+            with self.assertRaises(smtplib.SMTPException):
+                self.pool.acquire()
+
+    def test_close_all(self):
+        """Test that close_all quits every idle session."""
+        conns = [self.pool.acquire(), self.pool.acquire()]
+        for conn in conns:
+            self.pool.release(conn)
+
+        self.pool.close_all()
+
+        for conn in conns:
+            conn.quit.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()